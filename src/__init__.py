@@ -19,6 +19,7 @@ __all__ = [
     'MemoryExtractor',
     'DiskExtractor',
     'ProcessExtractor',
+    'FusedTriggerExtractor',
     'SystemMonitor',
     'validate_monitor_args',
     'validate_monitor_interval',
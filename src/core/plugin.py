@@ -3,20 +3,21 @@ Core plugin functionality for machine data extraction
 """
 
 import datetime
-from typing import Dict, Any
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Iterable, Optional
 import logging
 
-from ..extractors import (
-    SystemExtractor,
-    CpuExtractor,
-    MemoryExtractor,
-    DiskExtractor,
-    ProcessExtractor
-)
+from ..extractors import get_extractor, invalidate_all
+from ..extractors.shell_bulk import fetch_bulk
 from ..monitoring import SystemMonitor
 
 logger = logging.getLogger(__name__)
 
+# Maximum time to wait for a single extractor before dropping its section
+EXTRACTOR_TIMEOUT = 15
+
 
 class MachineDataExtractorPlugin:
     """Main plugin class for machine data extraction"""
@@ -30,22 +31,93 @@ class MachineDataExtractorPlugin:
         """
         self.config = config
         
-        # Initialize extractors
+        # Extractors are process-wide singletons; 'trigger' reads CPU and
+        # memory together for the monitoring trigger checks
         self.extractors = {
-            'system': SystemExtractor(),
-            'cpu': CpuExtractor(),
-            'memory': MemoryExtractor(),
-            'disk': DiskExtractor(),
-            'processes': ProcessExtractor()
+            name: get_extractor(name)
+            for name in ('system', 'cpu', 'memory', 'disk', 'processes', 'trigger')
         }
+
+        # Extractors are independent and I/O bound, so run them concurrently.
+        # The pool is reused across monitoring cycles.
+        self._pool = ThreadPoolExecutor(max_workers=len(self.extractors),
+                                        thread_name_prefix='extractor')
         
         # Initialize monitor if needed
         self.monitor = None
         if config.get('monitor_interval', 0) > 0:
             self.monitor = SystemMonitor(config)
-        
+            # Only a long-running monitor has caches worth refreshing
+            self._install_sighup_handler()
+
         logger.info("Initialized Machine Data Extractor plugin")
 
+    @staticmethod
+    def _install_sighup_handler() -> None:
+        """
+        Re-read cached CPU count, total memory and hostname when SIGHUP is received
+
+        The handler is only installed while SIGHUP has its default action, so
+        a handler set up by an embedding application is left alone.
+        """
+        # Signal handlers can only be installed from the main thread
+        if not hasattr(signal, 'SIGHUP') or threading.current_thread() is not threading.main_thread():
+            return
+        if signal.getsignal(signal.SIGHUP) is not signal.SIG_DFL:
+            logger.debug("SIGHUP already handled, not installing the cache refresh handler")
+            return
+
+        def handle_sighup(signum, frame):
+            logger.info("Received SIGHUP, refreshing cached CPU count, total memory and hostname")
+            invalidate_all()
+
+        signal.signal(signal.SIGHUP, handle_sighup)
+
+    def _fetch_bulk(self, keys: Iterable[str]) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Run the shell commands needed by the given extractors in one subprocess
+
+        Only the non-Linux fallbacks shell out. A single command gains nothing
+        from fusing, so its extractor keeps running it on its own.
+
+        Args:
+            keys: Extractor names about to be run
+
+        Returns:
+            Shared command output for this cycle, or None
+        """
+        sections = [self.extractors[key].bulk_section for key in keys
+                    if self.extractors[key].bulk_section]
+        if len(sections) < 2:
+            return None
+        try:
+            return fetch_bulk(sections)
+        except Exception as e:
+            logger.warning("Failed to fetch shared command output: %s", e)
+            return None
+
+    def _extract_sections(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Run the given extractors concurrently and collect their results
+
+        Args:
+            keys: Extractor names, in the order they should appear in the output
+
+        Returns:
+            Dictionary mapping each extractor name to its extracted data
+        """
+        keys = list(keys)
+        bulk = self._fetch_bulk(keys)
+        futures = {key: self._pool.submit(self.extractors[key].safe_extract, bulk) for key in keys}
+        sections = {}
+        for key, future in futures.items():
+            try:
+                sections[key] = future.result(timeout=EXTRACTOR_TIMEOUT)
+            except FutureTimeoutError:
+                logger.error("Timed out after %ss extracting %s data", EXTRACTOR_TIMEOUT, key)
+                sections[key] = {}
+        return sections
+
     def extract_data(self) -> Dict[str, Any]:
         """
         Extract machine data based on configuration
@@ -59,21 +131,22 @@ class MachineDataExtractorPlugin:
         }
 
         # Always include system info
-        data['system'] = self.extractors['system'].safe_extract()
+        keys = ['system']
 
         # Only extract if explicitly enabled
         if self.config.get('extract_cpu', False):
-            data['cpu'] = self.extractors['cpu'].safe_extract()
+            keys.append('cpu')
 
         if self.config.get('extract_memory', False):
-            data['memory'] = self.extractors['memory'].safe_extract()
+            keys.append('memory')
 
         if self.config.get('extract_disk', False):
-            data['disk'] = self.extractors['disk'].safe_extract()
+            keys.append('disk')
 
         if self.config.get('extract_processes', False):
-            data['processes'] = self.extractors['processes'].safe_extract()
+            keys.append('processes')
 
+        data.update(self._extract_sections(keys))
         return data
 
     def extract_data_for_monitoring(self) -> Dict[str, Any]:
@@ -88,20 +161,22 @@ class MachineDataExtractorPlugin:
             'timestamp': datetime.datetime.now().isoformat()
         }
 
-        # Always include system info
-        data['system'] = self.extractors['system'].safe_extract()
-
-        # Always include CPU and memory for trigger checks
-        data['cpu'] = self.extractors['cpu'].safe_extract()
-        data['memory'] = self.extractors['memory'].safe_extract()
+        # Always include system info, plus CPU and memory for trigger checks
+        keys = ['system', 'trigger']
 
         # Include other data if explicitly enabled
         if self.config.get('extract_disk', False):
-            data['disk'] = self.extractors['disk'].safe_extract()
+            keys.append('disk')
 
         if self.config.get('extract_processes', False):
-            data['processes'] = self.extractors['processes'].safe_extract()
-
+            keys.append('processes')
+
+        for key, section in self._extract_sections(keys).items():
+            if key == 'trigger':
+                # Fused extraction returns the 'cpu' and 'memory' sections
+                data.update(section)
+            else:
+                data[key] = section
         return data
 
     def start_monitoring(self) -> None:
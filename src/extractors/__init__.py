@@ -2,12 +2,67 @@
 Data extractors for system monitoring
 """
 
+import atexit
+from typing import Dict
+
 from .base import BaseExtractor
 from .system_extractor import SystemExtractor
 from .cpu_extractor import CpuExtractor
 from .memory_extractor import MemoryExtractor
 from .disk_extractor import DiskExtractor
 from .process_extractor import ProcessExtractor
+from .trigger_extractor import FusedTriggerExtractor
+
+# One instance per extractor for the whole process, so persistent /proc
+# descriptors are opened once and sampling state (such as the previous
+# /proc/stat snapshot) survives across plugin instances
+_SYSTEM = SystemExtractor()
+_CPU = CpuExtractor()
+_MEMORY = MemoryExtractor()
+_DISK = DiskExtractor()
+_PROCESSES = ProcessExtractor()
+# Shares the CPU and memory instances so CPU usage deltas stay continuous
+_TRIGGER = FusedTriggerExtractor(_CPU, _MEMORY)
+
+_EXTRACTORS: Dict[str, BaseExtractor] = {
+    'system': _SYSTEM,
+    'cpu': _CPU,
+    'memory': _MEMORY,
+    'disk': _DISK,
+    'processes': _PROCESSES,
+    'trigger': _TRIGGER
+}
+
+
+def get_extractor(name: str) -> BaseExtractor:
+    """
+    Get the shared extractor instance for a data section
+
+    Args:
+        name: Section name, one of system, cpu, memory, disk, processes or trigger
+
+    Returns:
+        The process-wide extractor instance
+
+    Raises:
+        KeyError: If no extractor has that name
+    """
+    return _EXTRACTORS[name]
+
+
+def close_all() -> None:
+    """Release the resources held by every shared extractor"""
+    for extractor in _EXTRACTORS.values():
+        extractor.close()
+
+
+def invalidate_all() -> None:
+    """Make every shared extractor re-read its cached values, e.g. after CPU or memory hot-plug"""
+    for extractor in _EXTRACTORS.values():
+        extractor.invalidate_cache()
+
+
+atexit.register(close_all)
 
 __all__ = [
     'BaseExtractor',
@@ -15,5 +70,9 @@ __all__ = [
     'CpuExtractor',
     'MemoryExtractor',
     'DiskExtractor',
-    'ProcessExtractor'
-]
\ No newline at end of file
+    'ProcessExtractor',
+    'FusedTriggerExtractor',
+    'get_extractor',
+    'close_all',
+    'invalidate_all'
+]
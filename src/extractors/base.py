@@ -2,25 +2,104 @@
 Base extractor class for system data extraction
 """
 
+import os
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Callable
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; extractor modules use it to pick their implementation
+IS_LINUX = sys.platform.startswith('linux')
+
+
+class ProcFile:
+    """
+    Read-only /proc file kept open across extractions
+
+    procfs regenerates the file content on every read from offset 0, so a
+    single descriptor can be re-read with pread() instead of being reopened
+    on each monitoring cycle.
+    """
+
+    def __init__(self, path: str, size: int = 8192):
+        """
+        Initialize the file wrapper; the descriptor is opened on first read
+
+        Args:
+            path: Path of the /proc file
+            size: Maximum number of bytes to read
+        """
+        self.path = path
+        self.size = size
+        self._fd: Optional[int] = None
+        self._buffer: Optional[bytearray] = None
+
+    def _get_fd(self) -> int:
+        """Open the descriptor on first use"""
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDONLY)
+        return self._fd
+
+    def read(self) -> bytes:
+        """
+        Read the current file content
+
+        Returns:
+            Up to size bytes from the start of the file
+        """
+        return os.pread(self._get_fd(), self.size, 0)
+
+    def read_first_line(self) -> bytes:
+        """
+        Read the first line of the file
+
+        The content is read into a buffer that is reused across calls, and
+        only the first line is copied out of it.
+
+        Returns:
+            First line without its trailing newline
+        """
+        if self._buffer is None:
+            self._buffer = bytearray(self.size)
+        length = os.preadv(self._get_fd(), [self._buffer], 0)
+        end = self._buffer.find(b'\n', 0, length)
+        return bytes(memoryview(self._buffer)[:end if end >= 0 else length])
+
+    def close(self) -> None:
+        """Close the underlying descriptor if it is open"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __del__(self):
+        """Release the descriptor of a wrapper dropped without close()"""
+        try:
+            self.close()
+        except OSError:
+            pass
+
 
 class BaseExtractor(ABC):
     """Abstract base class for all data extractors"""
+
+    # Name of the shell_bulk command this extractor parses, if it shells out
+    bulk_section: Optional[str] = None
     
     def __init__(self):
         """Initialize the extractor"""
         logger.debug(f"Initializing {self.__class__.__name__}")
     
     @abstractmethod
-    def extract(self) -> Dict[str, Any]:
+    def extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
         """
         Extract data from the system
         
+        Args:
+            bulk: Command output shared for this cycle by shell_bulk.fetch_bulk,
+                with None for commands that failed
+
         Returns:
             Dictionary containing extracted data
         """
@@ -37,16 +116,46 @@ class BaseExtractor(ABC):
             True if data is valid, False otherwise
         """
         return isinstance(data, dict)
+
+    def close(self) -> None:
+        """Release any resources held by the extractor"""
+        pass
+
+    def invalidate_cache(self) -> None:
+        """Forget cached values that only change on rare events such as hot-plug"""
+        pass
+
+    def safe_extract_part(self, part: Callable[[], Dict[str, Any]], description: str) -> Dict[str, Any]:
+        """
+        Run one independent part of an extraction with error handling
+
+        Used where a failed part should not discard the parts that succeeded.
+
+        Args:
+            part: Method returning the fields of this part
+            description: What the part reads, for the warning
+
+        Returns:
+            Fields returned by the part or empty dict on error
+        """
+        try:
+            return part()
+        except Exception as e:
+            logger.warning("%s failed to read %s: %s", self.__class__.__name__, description, e)
+            return {}
     
-    def safe_extract(self) -> Dict[str, Any]:
+    def safe_extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
         """
         Safely extract data with error handling
         
+        Args:
+            bulk: Command output shared for this cycle by shell_bulk.fetch_bulk
+
         Returns:
             Dictionary containing extracted data or empty dict on error
         """
         try:
-            data = self.extract()
+            data = self.extract(bulk)
             if self.validate_data(data):
                 return data
             else:
@@ -3,75 +3,101 @@ CPU information extractor
 """
 
 import os
-import platform
-import subprocess
-import re
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Optional, Tuple
 import logging
 
-from .base import BaseExtractor
+from .base import BaseExtractor, ProcFile, IS_LINUX
 
 logger = logging.getLogger(__name__)
 
+# Delay between the two /proc/stat samples taken on the very first extraction
+_SAMPLE_INTERVAL = 0.1
 
-class CpuExtractor(BaseExtractor):
-    """Extracts CPU information"""
-    
-    def extract(self) -> Dict[str, Any]:
+
+def _usable_cpu_count() -> Optional[int]:
+    """
+    Count the CPUs this process may run on
+
+    Unlike os.cpu_count(), the affinity mask reflects cgroup and taskset
+    pinning, so containers report the CPUs they actually get.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # sched_getaffinity is not available on every platform
+        return os.cpu_count()
+
+
+class _GenericCpuExtractor(BaseExtractor):
+    """Extracts CPU information available on any platform"""
+
+    def __init__(self):
+        """Initialize the extractor"""
+        super().__init__()
+        # CPUs only come and go with hot-plug or re-pinning, see invalidate_cache
+        self._cpu_count: Optional[int] = None
+
+    def invalidate_cache(self) -> None:
+        """Count the CPUs again on the next extraction"""
+        self._cpu_count = None
+
+    def extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
+        """Extract CPU information"""
+        if self._cpu_count is None:
+            self._cpu_count = _usable_cpu_count()
+        return {'cpu_count': self._cpu_count}
+
+
+class _LinuxCpuExtractor(_GenericCpuExtractor):
+    """Extracts CPU information from procfs"""
+
+    def __init__(self):
+        """Initialize the extractor"""
+        super().__init__()
+        # (idle, total) jiffies from the previous /proc/stat sample
+        self._last_stat: Optional[Tuple[int, int]] = None
+        # Only the aggregate first line is needed, which is always well under 4 KiB
+        self._stat_file = ProcFile('/proc/stat', 4096)
+
+    def _read_stat(self) -> Tuple[int, int]:
+        """
+        Read the aggregate CPU line of /proc/stat
+
+        Returns:
+            Tuple of (idle + iowait, total) jiffies
+        """
+        line = self._stat_file.read_first_line()
+        if not line.startswith(b'cpu '):
+            raise ValueError("Unexpected /proc/stat format")
+        # int() accepts bytes directly, so no str objects are created per field
+        user, nice, system, idle, iowait, irq, softirq, steal = map(int, line.split()[1:9])
+        return idle + iowait, user + nice + system + idle + iowait + irq + softirq + steal
+
+    def close(self) -> None:
+        """Close the persistent /proc/stat descriptor"""
+        self._stat_file.close()
+
+    def _extract_cpu_percent(self) -> Dict[str, Any]:
+        """CPU usage from the /proc/stat jiffy delta since the previous sample"""
+        if self._last_stat is None:
+            self._last_stat = self._read_stat()
+            time.sleep(_SAMPLE_INTERVAL)
+        idle, total = self._read_stat()
+        last_idle, last_total = self._last_stat
+        total_delta = total - last_total
+        if total_delta <= 0:
+            # No tick elapsed since the last sample, keep it for the next call
+            return {'cpu_percent': None}
+        self._last_stat = (idle, total)
+        return {'cpu_percent': round((1 - (idle - last_idle) / total_delta) * 100, 1)}
+
+    def extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
         """Extract CPU information"""
-        try:
-            cpu_info = {}
-
-            # CPU count using os
-            try:
-                cpu_info['cpu_count'] = os.cpu_count()
-            except Exception:
-                cpu_info['cpu_count'] = None
-
-            # Try to get CPU info from /proc/cpuinfo on Linux
-            try:
-                if platform.system() == 'Linux':
-                    with open('/proc/cpuinfo', 'r') as f:
-                        cpuinfo = f.read()
-                    cpu_count = cpuinfo.count('processor\t:')
-                    if cpu_count > 0:
-                        cpu_info['cpu_count'] = cpu_count
-            except Exception:
-                pass
-
-            # CPU usage using top or similar
-            try:
-                if platform.system() == 'Linux':
-                    result = subprocess.run(['top', '-bn1'], capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        lines = result.stdout.split('\n')
-                        for line in lines:
-                            if '%Cpu(s):' in line:
-                                # Parse CPU usage from top output
-                                # Format: %Cpu(s):  9.8 us,  8.7 sy,  0.0 ni, 81.5 id,  0.0 wa,  0.0 hi,  0.0 si,  0.0 st
-                                # We want the total idle percentage, then calculate used as 100 - idle
-                                # Use regex to find the idle percentage more reliably
-                                match = re.search(r'(\d+\.\d+)\s+id', line)
-                                if match:
-                                    try:
-                                        idle_percent = float(match.group(1))
-                                        cpu_info['cpu_percent'] = round(100.0 - idle_percent, 1)
-                                    except (ValueError, IndexError):
-                                        cpu_info['cpu_percent'] = None
-                                else:
-                                    # Fallback to old parsing if regex fails
-                                    parts = line.split()
-                                    if len(parts) >= 8:  # Make sure we have enough parts
-                                        try:
-                                            idle_percent = float(parts[7].rstrip(','))  # The 'id' (idle) percentage
-                                            cpu_info['cpu_percent'] = round(100.0 - idle_percent, 1)
-                                        except (ValueError, IndexError):
-                                            cpu_info['cpu_percent'] = None
-                                break
-            except Exception:
-                pass
-
-            return cpu_info
-        except Exception as e:
-            logger.error(f"Failed to extract CPU info: {str(e)}")
-            return {}
\ No newline at end of file
+        cpu_info = super().extract(bulk)
+        cpu_info.update(self.safe_extract_part(self._extract_cpu_percent, '/proc/stat'))
+        return cpu_info
+
+
+# The platform cannot change at runtime, so pick the implementation once
+CpuExtractor = _LinuxCpuExtractor if IS_LINUX else _GenericCpuExtractor
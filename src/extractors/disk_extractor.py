@@ -3,63 +3,210 @@ Disk information extractor
 """
 
 import os
-import subprocess
-import platform
-from typing import Dict, Any, List
+import re
+import select
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
-from .base import BaseExtractor
+from .base import BaseExtractor, IS_LINUX
+from .shell_bulk import command_output
 
 logger = logging.getLogger(__name__)
 
+# Kernel pseudo filesystems that do not describe storage. df leaves them out
+# because they report no blocks; skipping them by type also saves a statvfs
+# call each. tmpfs and devtmpfs are kept, as df shows them too, and any other
+# blockless filesystem is still dropped by the size check after statvfs.
+_IGNORED_FSTYPES = frozenset({
+    'autofs', 'binfmt_misc', 'bpf', 'cgroup', 'cgroup2', 'configfs', 'debugfs',
+    'devpts', 'fusectl', 'hugetlbfs', 'mqueue', 'nsfs', 'proc', 'pstore',
+    'rpc_pipefs', 'securityfs', 'selinuxfs', 'sysfs', 'tracefs'
+})
 
-class DiskExtractor(BaseExtractor):
-    """Extracts disk information"""
-    
-    def extract(self) -> Dict[str, Any]:
+_MOUNTS_PATH = '/proc/self/mounts'
+
+# Octal escapes (e.g. '\\040' for space) used in /proc/mounts fields
+_OCTAL_ESCAPE_RE = re.compile(r'\\([0-7]{3})')
+
+
+def _decode_octal_escape(match: re.Match) -> str:
+    """Turn one octal escape match back into its character"""
+    return chr(int(match.group(1), 8))
+
+
+def _unescape_mount_field(field: str) -> str:
+    """Decode the octal escapes used in /proc/mounts"""
+    if '\\' not in field:
+        return field
+    return _OCTAL_ESCAPE_RE.sub(_decode_octal_escape, field)
+
+
+def _usage_from_statvfs(path: str) -> Dict[str, Any]:
+    """
+    Compute filesystem usage in bytes for a mount point
+
+    Args:
+        path: Mount point to query
+
+    Returns:
+        Dictionary with total, free, used and percent
+    """
+    statvfs = os.statvfs(path)
+    total = statvfs.f_blocks * statvfs.f_frsize
+    free = statvfs.f_bavail * statvfs.f_frsize
+    usage = {
+        'total': total,
+        'free': free,
+        'used': total - free
+    }
+    if total > 0:
+        usage['percent'] = round((usage['used'] / total) * 100, 1)
+    return usage
+
+
+class _GenericDiskExtractor(BaseExtractor):
+    """Extracts disk information using the df command"""
+
+    bulk_section = 'df'
+
+    def _read_partitions(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> List[Dict[str, Any]]:
+        """
+        Read partitions from the df command
+
+        Args:
+            bulk: Shared command output that may already contain the df output
+
+        Returns:
+            List of partition dictionaries with sizes in bytes
+        """
+        partitions = []
+        output = command_output('df', bulk)
+        if output is not None:
+            lines = output.strip().split('\n')
+            for line in lines[1:]:
+                parts = line.split(None, 5)
+                if len(parts) >= 6:
+                    try:
+                        total = int(parts[1]) * 1024
+                        free = int(parts[3]) * 1024
+                    except ValueError:
+                        continue
+                    partition = {
+                        'filesystem': parts[0],
+                        'mountpoint': parts[5],
+                        'total': total,
+                        'free': free,
+                        'used': total - free
+                    }
+                    if total > 0:
+                        partition['percent'] = round((partition['used'] / total) * 100, 1)
+                    partitions.append(partition)
+        return partitions
+
+    def _extract_partitions(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
+        """Disk partitions"""
+        return {'partitions': self._read_partitions(bulk)}
+
+    def _extract_root_usage(self) -> Dict[str, Any]:
+        """Disk usage for root filesystem"""
+        return {'root_usage': _usage_from_statvfs('/')}
+
+    def extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
         """Extract disk information"""
-        try:
-            disk_info = {
-                'partitions': []
-            }
+        disk_info = {'partitions': []}
+        disk_info.update(self.safe_extract_part(lambda: self._extract_partitions(bulk), 'disk partitions'))
+        disk_info.update(self.safe_extract_part(self._extract_root_usage, 'root filesystem usage'))
+        return disk_info
 
-            # Disk partitions using df command
-            try:
-                result = subprocess.run(['df', '-h'], capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    if len(lines) > 1:
-                        headers = lines[0].split()
-                        for line in lines[1:]:
-                            parts = line.split()
-                            if len(parts) >= 6:
-                                disk_info['partitions'].append({
-                                    'filesystem': parts[0],
-                                    'size': parts[1],
-                                    'used': parts[2],
-                                    'available': parts[3],
-                                    'use_percent': parts[4],
-                                    'mountpoint': parts[5]
-                                })
-            except Exception as e:
-                logger.warning(f"Failed to run df command: {str(e)}")
-
-            # Disk usage for root filesystem
+
+class _LinuxDiskExtractor(_GenericDiskExtractor):
+    """Extracts disk information from the mount table"""
+
+    bulk_section = None
+
+    def __init__(self):
+        """Initialize the extractor"""
+        super().__init__()
+        # Descriptor polled for mount table changes. The kernel flags it with
+        # POLLPRI after each mount or unmount, so the table is only re-read then.
+        self._mounts_fd: Optional[int] = None
+        self._mounts_poll: Optional[select.poll] = None
+        # (filesystem, mountpoint, fstype) of the real filesystems last read
+        self._mounts: List[Tuple[str, str, str]] = []
+
+    def close(self) -> None:
+        """Close the descriptor used to watch the mount table"""
+        if self._mounts_fd is not None:
+            os.close(self._mounts_fd)
+            self._mounts_fd = None
+            self._mounts_poll = None
+
+    def _mounts_changed(self) -> bool:
+        """Check whether the mount table changed since the last check"""
+        if self._mounts_fd is None:
+            self._mounts_fd = os.open(_MOUNTS_PATH, os.O_RDONLY)
+            self._mounts_poll = select.poll()
+            self._mounts_poll.register(self._mounts_fd, select.POLLPRI)
+            return True
+        return bool(self._mounts_poll.poll(0))
+
+    def _read_mounts(self) -> List[Tuple[str, str, str]]:
+        """
+        Read the real filesystems from /proc/self/mounts
+
+        Like df, a mountpoint mounted more than once (stacked or bind mounts)
+        is reported once, for the last mount, which is the one visible there.
+
+        Returns:
+            List of (filesystem, mountpoint, fstype) tuples
+        """
+        mounts: Dict[str, Tuple[str, str, str]] = {}
+        with open(_MOUNTS_PATH, 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                mountpoint = _unescape_mount_field(parts[1])
+                # Re-insert so the mount keeps the position of its last entry
+                mounts.pop(mountpoint, None)
+                mounts[mountpoint] = (_unescape_mount_field(parts[0]), mountpoint, parts[2])
+        # Filtered after deduplicating, so a pseudo filesystem mounted over
+        # a real one hides it
+        return [mount for mount in mounts.values() if mount[2] not in _IGNORED_FSTYPES]
+
+    def _read_partitions(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> List[Dict[str, Any]]:
+        """
+        Size the mounted filesystems with statvfs
+
+        The mount list is cached and only re-read when the mount table changes.
+
+        Args:
+            bulk: Unused, the mount table is read directly
+
+        Returns:
+            List of partition dictionaries with sizes in bytes
+        """
+        if self._mounts_changed():
+            self._mounts = self._read_mounts()
+
+        partitions = []
+        for filesystem, mountpoint, fstype in self._mounts:
             try:
-                statvfs = os.statvfs('/')
-                disk_info['root_usage'] = {
-                    'total': statvfs.f_blocks * statvfs.f_frsize,
-                    'free': statvfs.f_available * statvfs.f_frsize,
-                    'used': (statvfs.f_blocks - statvfs.f_available) * statvfs.f_frsize
-                }
-                if disk_info['root_usage']['total'] > 0:
-                    disk_info['root_usage']['percent'] = round(
-                        (disk_info['root_usage']['used'] / disk_info['root_usage']['total']) * 100, 1
-                    )
-            except Exception as e:
-                logger.warning(f"Failed to get root filesystem usage: {str(e)}")
-
-            return disk_info
-        except Exception as e:
-            logger.error(f"Failed to extract disk info: {str(e)}")
-            return {}
\ No newline at end of file
+                usage = _usage_from_statvfs(mountpoint)
+            except OSError as e:
+                logger.debug("Skipping %s: %s", mountpoint, e)
+                continue
+            # Like df, hide filesystems without any blocks
+            if not usage['total']:
+                continue
+            partitions.append({
+                'filesystem': filesystem,
+                'mountpoint': mountpoint,
+                'fstype': fstype,
+                **usage
+            })
+        return partitions
+
+
+# The platform cannot change at runtime, so pick the implementation once
+DiskExtractor = _LinuxDiskExtractor if IS_LINUX else _GenericDiskExtractor
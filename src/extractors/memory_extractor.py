@@ -2,70 +2,132 @@
 Memory information extractor
 """
 
-import platform
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
-from .base import BaseExtractor
+from .base import BaseExtractor, ProcFile, IS_LINUX
 
 logger = logging.getLogger(__name__)
 
+# /proc/meminfo fields used in the output; every other line is skipped unparsed
+_MEMINFO_FIELDS = (
+    b'MemTotal:', b'MemFree:', b'MemAvailable:', b'Buffers:', b'Cached:',
+    b'SwapCached:', b'Active:', b'Inactive:', b'SwapTotal:', b'SwapFree:'
+)
+# MemTotal only changes with memory hot-plug, so it is parsed once and cached
+_MEMINFO_FIELDS_WITHOUT_TOTAL = _MEMINFO_FIELDS[1:]
 
-class MemoryExtractor(BaseExtractor):
-    """Extracts memory information"""
-    
-    def extract(self) -> Dict[str, Any]:
+
+def _parse_meminfo(data: bytes, fields: tuple) -> Dict[bytes, int]:
+    """
+    Parse the wanted /proc/meminfo fields by searching for them
+
+    Only the wanted values are sliced out; the other lines are never split.
+
+    Args:
+        data: Raw /proc/meminfo content
+        fields: Field names, including the trailing colon
+
+    Returns:
+        Dictionary mapping each field name to its value in bytes
+    """
+    meminfo = {}
+    for field in fields:
+        if data.startswith(field):
+            start = len(field)
+        else:
+            # Anchor on the line start so 'Cached:' does not match 'SwapCached:'
+            start = data.find(b'\n' + field)
+            if start < 0:
+                continue
+            start += len(field) + 1
+        end = data.find(b'\n', start)
+        value = data[start:end] if end >= 0 else data[start:]
+        if value.endswith(b' kB'):
+            value = value[:-3]
+        meminfo[field] = int(value) << 10  # kB to bytes, int() skips the padding
+    return meminfo
+
+
+class _GenericMemoryExtractor(BaseExtractor):
+    """Fallback memory extractor for platforms without /proc/meminfo"""
+
+    def extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
         """Extract memory information"""
-        try:
-            memory_info = {}
-
-            # Memory info from /proc/meminfo on Linux
-            if platform.system() == 'Linux':
-                try:
-                    with open('/proc/meminfo', 'r') as f:
-                        meminfo = {}
-                        for line in f:
-                            parts = line.split()
-                            if len(parts) >= 2:
-                                key = parts[0].rstrip(':')
-                                value = int(parts[1]) * 1024  # Convert to bytes
-                                meminfo[key] = value
-
-                    memory_info['virtual_memory'] = {
-                        'total': meminfo.get('MemTotal'),
-                        'free': meminfo.get('MemFree'),
-                        'available': meminfo.get('MemAvailable'),
-                        'buffers': meminfo.get('Buffers', 0),
-                        'cached': meminfo.get('Cached', 0),
-                        'swap_cached': meminfo.get('SwapCached', 0),
-                        'active': meminfo.get('Active', 0),
-                        'inactive': meminfo.get('Inactive', 0)
-                    }
-
-                    # Calculate used and percent
-                    if memory_info['virtual_memory']['total']:
-                        total = memory_info['virtual_memory']['total']
-                        free = memory_info['virtual_memory'].get('free', 0)
-                        used = total - free
-                        memory_info['virtual_memory']['used'] = used
-                        memory_info['virtual_memory']['percent'] = round((used / total) * 100, 1)
-
-                    # Swap memory
-                    memory_info['swap_memory'] = {
-                        'total': meminfo.get('SwapTotal'),
-                        'free': meminfo.get('SwapFree')
-                    }
-                    if memory_info['swap_memory']['total']:
-                        total = memory_info['swap_memory']['total']
-                        free = memory_info['swap_memory'].get('free', 0)
-                        used = total - free
-                        memory_info['swap_memory']['used'] = used
-                        memory_info['swap_memory']['percent'] = round((used / total) * 100, 1) if total > 0 else 0
-
-                except Exception as e:
-                    logger.warning(f"Failed to read /proc/meminfo: {str(e)}")
-
-            return memory_info
-        except Exception as e:
-            logger.error(f"Failed to extract memory info: {str(e)}")
-            return {}
\ No newline at end of file
+        return {}
+
+
+class _LinuxMemoryExtractor(_GenericMemoryExtractor):
+    """Extracts memory information from /proc/meminfo"""
+
+    def __init__(self):
+        """Initialize the extractor"""
+        super().__init__()
+        self._meminfo_file = ProcFile('/proc/meminfo')
+        self._total_bytes: Optional[int] = None
+
+    def close(self) -> None:
+        """Close the persistent /proc/meminfo descriptor"""
+        self._meminfo_file.close()
+
+    def invalidate_total(self) -> None:
+        """Parse MemTotal again on the next extraction"""
+        self._total_bytes = None
+
+    def invalidate_cache(self) -> None:
+        """Forget the cached MemTotal"""
+        self.invalidate_total()
+
+    def extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
+        """Extract memory information"""
+        data = self._meminfo_file.read()
+        if self._total_bytes is None:
+            meminfo = _parse_meminfo(data, _MEMINFO_FIELDS)
+            self._total_bytes = meminfo.get(b'MemTotal:')
+        else:
+            meminfo = _parse_meminfo(data, _MEMINFO_FIELDS_WITHOUT_TOTAL)
+            available = meminfo.get(b'MemAvailable:')
+            if available is not None and available > self._total_bytes:
+                # More memory available than the cached total: memory was hot-plugged
+                meminfo = _parse_meminfo(data, _MEMINFO_FIELDS)
+                self._total_bytes = meminfo.get(b'MemTotal:')
+
+        total = self._total_bytes
+        free = meminfo.get(b'MemFree:')
+        virtual_memory = {
+            'total': total,
+            'free': free,
+            'available': meminfo.get(b'MemAvailable:'),
+            'buffers': meminfo.get(b'Buffers:', 0),
+            'cached': meminfo.get(b'Cached:', 0),
+            'swap_cached': meminfo.get(b'SwapCached:', 0),
+            'active': meminfo.get(b'Active:', 0),
+            'inactive': meminfo.get(b'Inactive:', 0)
+        }
+
+        # Calculate used and percent
+        if total:
+            used = total - (free or 0)
+            virtual_memory['used'] = used
+            virtual_memory['percent'] = round((used / total) * 100, 1)
+
+        # Swap memory
+        swap_total = meminfo.get(b'SwapTotal:')
+        swap_free = meminfo.get(b'SwapFree:')
+        swap_memory = {
+            'total': swap_total,
+            'free': swap_free
+        }
+        if swap_total:
+            used = swap_total - (swap_free or 0)
+            swap_memory['used'] = used
+            swap_memory['percent'] = round((used / swap_total) * 100, 1)
+
+        return {
+            'virtual_memory': virtual_memory,
+            'swap_memory': swap_memory
+        }
+
+
+# The platform cannot change at runtime, so pick the implementation once
+MemoryExtractor = _LinuxMemoryExtractor if IS_LINUX else _GenericMemoryExtractor
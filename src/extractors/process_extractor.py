@@ -2,61 +2,322 @@
 Process information extractor
 """
 
-import subprocess
-import platform
-from typing import Dict, Any, List
+import os
+import heapq
+import datetime
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
-from .base import BaseExtractor
+try:
+    import pwd
+except ImportError:  # pragma: no cover - non-Unix platforms
+    pwd = None
+
+from .base import BaseExtractor, IS_LINUX
+from .shell_bulk import command_output
 
 logger = logging.getLogger(__name__)
 
+_PROC_ROOT = '/proc'
+
+# Number of processes reported, ranked by CPU usage
+TOP_PROCESS_COUNT = 50
+
+# Upper bound on /proc/[pid]/stat descriptors kept open between scans,
+# well below the common 1024 open file limit
+_MAX_STAT_FDS = 512
+
+# /proc/[pid]/stat is a single short line; comm is capped at 16 bytes
+_STAT_READ_SIZE = 4096
+
+
+def _format_tty(tty_nr: int) -> str:
+    """Render a /proc/[pid]/stat tty_nr the way ps does"""
+    if tty_nr == 0:
+        return '?'
+    major = (tty_nr >> 8) & 0xfff
+    minor = (tty_nr & 0xff) | ((tty_nr >> 12) & 0xfff00)
+    if 136 <= major <= 143:
+        return f"pts/{minor + (major - 136) * 256}"
+    if major == 4:
+        return f"tty{minor}"
+    return str(tty_nr)
+
+
+class _GenericProcessExtractor(BaseExtractor):
+    """Extracts process information using the ps command"""
+
+    bulk_section = 'ps'
+
+    def _read_processes(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> List[Dict[str, Any]]:
+        """
+        Read process information from the ps command
+
+        Args:
+            bulk: Shared command output that may already contain the ps output
+
+        Returns:
+            List of process dictionaries
+        """
+        processes = []
+        output = command_output('ps', bulk)
+        if output is not None:
+            lines = output.strip().split('\n')
+            # Skip header
+            for line in lines[1:]:
+                try:
+                    # Split on whitespace, max 11 parts; short lines fail to unpack
+                    user, pid, cpu, mem, vsz, rss, tty, stat, start, time, command = line.split(None, 10)
+                    processes.append({
+                        'user': user,
+                        'pid': int(pid),
+                        'cpu_percent': float(cpu),
+                        'memory_percent': float(mem),
+                        'vsz': int(vsz),  # Virtual memory size in KiB
+                        'rss': int(rss),  # Resident set size in KiB
+                        'tty': tty,
+                        'stat': stat,
+                        'start': start,
+                        'time': time,
+                        'command': command
+                    })
+                except ValueError:
+                    continue
+        return processes
+
+    def _top_processes(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Find the busiest processes
 
-class ProcessExtractor(BaseExtractor):
-    """Extracts process information"""
-    
-    def extract(self) -> Dict[str, Any]:
+        Args:
+            bulk: Shared command output that may already contain the ps output
+
+        Returns:
+            Tuple of (number of processes, TOP_PROCESS_COUNT busiest processes
+            by CPU usage descending)
+        """
+        processes = self._read_processes(bulk)
+
+        # Keep the busiest processes without sorting them all
+        return len(processes), heapq.nlargest(TOP_PROCESS_COUNT, processes,
+                                              key=lambda x: x['cpu_percent'])
+
+    def extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
         """Extract process information"""
+        process_count, top_processes = self._top_processes(bulk)
+
+        return {
+            'process_count': process_count,
+            'processes': top_processes
+        }
+
+
+class _LinuxProcessExtractor(_GenericProcessExtractor):
+    """Extracts process information from /proc/[pid]/stat"""
+
+    bulk_section = None
+
+    def __init__(self):
+        """Initialize the extractor"""
+        super().__init__()
+        self._user_names: Dict[int, str] = {}
+        # pid -> (start time, utime + stime) ticks from the previous scan; the
+        # start time tells a reused pid apart from the process seen before
+        self._last_cpu_ticks: Dict[int, Tuple[int, int]] = {}
+        self._last_uptime: Optional[float] = None
+        # pid -> open /proc/[pid]/stat descriptor, re-read with pread each scan
+        self._stat_fds: Dict[int, int] = {}
+        # Descriptor of the /proc directory; per-process files are opened
+        # relative to it, so only the last two path components are resolved
+        self._proc_fd: Optional[int] = None
+
+    def close(self) -> None:
+        """Close the /proc descriptors kept between scans"""
+        for fd in self._stat_fds.values():
+            os.close(fd)
+        self._stat_fds.clear()
+        if self._proc_fd is not None:
+            os.close(self._proc_fd)
+            self._proc_fd = None
+
+    def _get_proc_fd(self) -> int:
+        """Open the /proc directory descriptor on first use"""
+        if self._proc_fd is None:
+            self._proc_fd = os.open(_PROC_ROOT, os.O_RDONLY | os.O_DIRECTORY)
+        return self._proc_fd
+
+    def _open_in_proc(self, path: str, flags: int) -> int:
+        """Open a path relative to /proc; usable as an open() opener"""
+        return os.open(path, flags, dir_fd=self._proc_fd)
+
+    def _read_stat(self, pid: int) -> bytes:
+        """
+        Read /proc/[pid]/stat, reusing the descriptor from previous scans
+
+        A persistent descriptor turns open + read + close into a single pread.
+
+        Args:
+            pid: Process id
+
+        Returns:
+            Raw stat line
+        """
+        fd = self._stat_fds.get(pid)
+        if fd is not None:
+            try:
+                return os.pread(fd, _STAT_READ_SIZE, 0)
+            except ProcessLookupError:
+                # The process exited; the pid may now belong to a new process
+                del self._stat_fds[pid]
+                os.close(fd)
+
+        fd = self._open_in_proc(f"{pid}/stat", os.O_RDONLY)
         try:
-            processes = []
+            stat = os.pread(fd, _STAT_READ_SIZE, 0)
+        except BaseException:
+            os.close(fd)
+            raise
+        if len(self._stat_fds) < _MAX_STAT_FDS:
+            self._stat_fds[pid] = fd
+        else:
+            os.close(fd)
+        return stat
+
+    def _user_name(self, uid: int) -> str:
+        """Resolve a uid to a user name, caching lookups"""
+        name = self._user_names.get(uid)
+        if name is None:
+            try:
+                name = pwd.getpwuid(uid).pw_name if pwd else str(uid)
+            except KeyError:
+                name = str(uid)
+            self._user_names[uid] = name
+        return name
+
+    def _read_euid(self, pid: int) -> int:
+        """
+        Read the effective uid of a process from /proc/[pid]/status
+
+        ps reports the effective user, which differs from the owner of the
+        /proc/[pid] directory for setuid programs.
+
+        Args:
+            pid: Process id
+
+        Returns:
+            Effective uid
+        """
+        with open(f"{pid}/status", 'rb', opener=self._open_in_proc) as f:
+            for line in f:
+                if line.startswith(b'Uid:'):
+                    # Real, effective, saved set and filesystem uids
+                    return int(line.split()[2])
+            return os.fstat(f.fileno()).st_uid
+
+    def _top_processes(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Find the busiest processes from /proc/[pid]/stat
 
-            # Use ps command to get process information
+        Every process is ranked from its stat line alone through a bounded
+        heap; the command line, owner and output dict are only looked up
+        for the processes that make the top list.
+
+        Args:
+            bulk: Unused, procfs is read directly
+
+        Returns:
+            Tuple of (number of processes, TOP_PROCESS_COUNT busiest processes
+            by CPU usage descending, in the same shape as the ps fallback)
+        """
+        clock_ticks = os.sysconf('SC_CLK_TCK')
+        page_size = os.sysconf('SC_PAGE_SIZE')
+        mem_total = os.sysconf('SC_PHYS_PAGES') * page_size
+        with open(os.path.join(_PROC_ROOT, 'uptime'), 'rb') as f:
+            uptime = float(f.read().split()[0])
+        boot_time = datetime.datetime.now() - datetime.timedelta(seconds=uptime)
+        last_cpu_ticks = self._last_cpu_ticks
+        interval = uptime - self._last_uptime if self._last_uptime is not None else 0
+        cpu_ticks_by_pid = {}
+
+        # Min-heap of (cpu_percent, -scan order, pid, stat, rparen, fields);
+        # the negated scan order keeps earlier processes first among equal usage
+        top = []
+        process_count = 0
+        proc_fd = self._get_proc_fd()
+        for entry in os.scandir(proc_fd):
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            try:
+                # procfs files must be read in one call to get a consistent snapshot
+                stat = self._read_stat(pid)
+            except (FileNotFoundError, ProcessLookupError):
+                # Process exited while we were scanning
+                continue
+
+            # comm may contain spaces and parentheses, so split after the last ')'
+            rparen = stat.rfind(b')')
+            # Only the fields up to rss (index 21) are used; leave the rest unsplit
+            fields = stat[rparen + 2:].split(None, 22)
+            # Field numbers below are from proc(5), offset by the 3 leading fields
+            cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+            start_ticks = int(fields[19])
+
+            # Usage since the previous scan, or the lifetime average for new processes
+            cpu_ticks_by_pid[pid] = (start_ticks, cpu_ticks)
+            last = last_cpu_ticks.get(pid)
+            if last is not None and last[0] == start_ticks and interval > 0:
+                cpu_ticks_used, elapsed = cpu_ticks - last[1], interval
+            else:
+                cpu_ticks_used, elapsed = cpu_ticks, uptime - start_ticks / clock_ticks
+            cpu_percent = round(cpu_ticks_used / clock_ticks / elapsed * 100, 1) if elapsed > 0 else 0.0
+
+            process_count += 1
+            item = (cpu_percent, -process_count, pid, stat, rparen, fields)
+            if len(top) < TOP_PROCESS_COUNT:
+                heapq.heappush(top, item)
+            else:
+                heapq.heappushpop(top, item)
+
+        # Replacing the map drops processes that have exited
+        self._last_cpu_ticks = cpu_ticks_by_pid
+        for pid in self._stat_fds.keys() - cpu_ticks_by_pid.keys():
+            os.close(self._stat_fds.pop(pid))
+        self._last_uptime = uptime
+
+        processes = []
+        for cpu_percent, _, pid, stat, rparen, fields in sorted(top, reverse=True):
             try:
-                result = subprocess.run(['ps', 'aux'], capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    if len(lines) > 1:
-                        # Skip header
-                        for line in lines[1:]:
-                            parts = line.split(None, 10)  # Split on whitespace, max 11 parts
-                            if len(parts) >= 11:
-                                try:
-                                    processes.append({
-                                        'user': parts[0],
-                                        'pid': int(parts[1]),
-                                        'cpu_percent': float(parts[2]),
-                                        'memory_percent': float(parts[3]),
-                                        'vsz': parts[4],  # Virtual memory size
-                                        'rss': parts[5],  # Resident set size
-                                        'tty': parts[6],
-                                        'stat': parts[7],
-                                        'start': parts[8],
-                                        'time': parts[9],
-                                        'command': parts[10]
-                                    })
-                                except (ValueError, IndexError):
-                                    continue
-
-                        # Sort by CPU usage descending
-                        processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-
-            except Exception as e:
-                logger.warning(f"Failed to run ps command: {str(e)}")
-
-            return {
-                'process_count': len(processes),
-                'processes': processes[:50]  # Limit to top 50 processes
-            }
-        except Exception as e:
-            logger.error(f"Failed to extract process info: {str(e)}")
-            return {}
\ No newline at end of file
+                with open(f"{pid}/cmdline", 'rb', opener=self._open_in_proc) as f:
+                    cmdline = f.read()
+                uid = self._read_euid(pid)
+            except (FileNotFoundError, ProcessLookupError):
+                # Process exited since its stat line was read
+                continue
+
+            command = cmdline.replace(b'\0', b' ').strip().decode(errors='replace')
+            if not command:
+                # Kernel threads have no command line; show their comm like ps
+                comm = stat[stat.find(b'(') + 1:rparen].decode(errors='replace')
+                command = f"[{comm}]"
+            cpu_seconds = (int(fields[11]) + int(fields[12])) // clock_ticks
+            start_seconds = int(fields[19]) / clock_ticks
+            rss_bytes = int(fields[21]) * page_size
+            processes.append({
+                'user': self._user_name(uid),
+                'pid': pid,
+                'cpu_percent': cpu_percent,
+                'memory_percent': round(rss_bytes / mem_total * 100, 1) if mem_total else 0.0,
+                'vsz': int(fields[20]) // 1024,  # Virtual memory size in KiB
+                'rss': rss_bytes // 1024,  # Resident set size in KiB
+                'tty': _format_tty(int(fields[4])),
+                'stat': fields[0].decode(),
+                'start': (boot_time + datetime.timedelta(seconds=start_seconds)).isoformat(),
+                'time': f"{cpu_seconds // 60}:{cpu_seconds % 60:02d}",
+                'command': command
+            })
+        return process_count, processes
+
+
+# The platform cannot change at runtime, so pick the implementation once
+ProcessExtractor = _LinuxProcessExtractor if IS_LINUX else _GenericProcessExtractor
@@ -0,0 +1,77 @@
+"""
+Shared shell command output for the non-Linux extractors
+"""
+
+import shlex
+import subprocess
+from typing import Dict, Iterable, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Commands the fallback extractors parse, by bulk section name
+BULK_COMMANDS: Dict[str, List[str]] = {
+    'df': ['df', '-kP'],
+    'ps': ['ps', 'aux']
+}
+
+# Per-command timeout, matching the extractors' own subprocess calls
+COMMAND_TIMEOUT = 10
+
+
+def _marker(name: str) -> str:
+    """Line printed after a section's output, followed by its exit status"""
+    return f"--{name.upper()}--"
+
+
+def fetch_bulk(names: Iterable[str]) -> Dict[str, Optional[str]]:
+    """
+    Run several bulk commands in a single shell, paying for one fork/exec
+
+    Args:
+        names: Bulk section names from BULK_COMMANDS
+
+    Returns:
+        Dictionary mapping each section name to its output, or to None if
+        its command failed. Sections whose marker is missing are left out.
+    """
+    names = list(names)
+    script = '; '.join(
+        f"{shlex.join(BULK_COMMANDS[name])}; echo \"{_marker(name)} $?\"" for name in names
+    )
+    result = subprocess.run(['sh', '-c', script], capture_output=True, text=True,
+                            timeout=COMMAND_TIMEOUT * len(names))
+
+    markers = {_marker(name): name for name in names}
+    bulk = {}
+    lines: List[str] = []
+    for line in result.stdout.splitlines():
+        marker, _, status = line.rpartition(' ')
+        if marker in markers:
+            # Failures are recorded so command_output does not run them again
+            bulk[markers[marker]] = '\n'.join(lines) if status == '0' else None
+            lines = []
+        else:
+            lines.append(line)
+    return bulk
+
+
+def command_output(name: str, bulk: Optional[Dict[str, Optional[str]]] = None) -> Optional[str]:
+    """
+    Get the output of one bulk command
+
+    Args:
+        name: Bulk section name from BULK_COMMANDS
+        bulk: Output shared by fetch_bulk for this cycle, if any. The
+            command is only run on its own if bulk has no entry for it.
+
+    Returns:
+        The command's output, or None if it failed
+    """
+    if bulk and name in bulk:
+        return bulk[name]
+    result = subprocess.run(BULK_COMMANDS[name], capture_output=True, text=True,
+                            timeout=COMMAND_TIMEOUT)
+    if result.returncode != 0:
+        return None
+    return result.stdout
@@ -4,23 +4,49 @@ System information extractor
 
 import platform
 import socket
+import time
 import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
-from .base import BaseExtractor
+from .base import BaseExtractor, ProcFile, IS_LINUX
 
 logger = logging.getLogger(__name__)
 
+# The hostname can be changed while the plugin runs, so it is looked up
+# again once the cached value is this many seconds old
+HOSTNAME_TTL = 60
 
-class SystemExtractor(BaseExtractor):
+
+class _GenericSystemExtractor(BaseExtractor):
     """Extracts general system information"""
-    
-    def extract(self) -> Dict[str, Any]:
-        """Extract general system information"""
-        try:
-            system_info = {
-                'hostname': socket.gethostname(),
+
+    def __init__(self):
+        """Initialize the extractor"""
+        super().__init__()
+        # Information that never changes, captured on the first extraction.
+        # Deferred because platform.processor() may spawn uname, and the
+        # shared extractors are created when the package is imported.
+        self._static_info: Optional[Dict[str, Any]] = None
+        self._hostname: Optional[str] = None
+        self._hostname_expires = 0.0
+
+    def invalidate_cache(self) -> None:
+        """Look the hostname up again on the next extraction"""
+        self._hostname = None
+
+    def _get_hostname(self) -> str:
+        """Get the hostname, cached for HOSTNAME_TTL seconds"""
+        now = time.monotonic()
+        if self._hostname is None or now >= self._hostname_expires:
+            self._hostname = socket.gethostname()
+            self._hostname_expires = now + HOSTNAME_TTL
+        return self._hostname
+
+    def _get_static_info(self) -> Dict[str, Any]:
+        """Get the fields that never change, capturing them once"""
+        if self._static_info is None:
+            self._static_info = {
                 'platform': platform.platform(),
                 'system': platform.system(),
                 'release': platform.release(),
@@ -28,20 +54,47 @@ class SystemExtractor(BaseExtractor):
                 'machine': platform.machine(),
                 'processor': platform.processor()
             }
+        return self._static_info
+
+    def _extract_uptime(self) -> Dict[str, Any]:
+        """Extract the uptime fields, which change on every call"""
+        return {}
+
+    def extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
+        """Extract general system information"""
+        return {
+            'hostname': self._get_hostname(),
+            **self._get_static_info(),
+            **self.safe_extract_part(self._extract_uptime, 'uptime')
+        }
+
+
+class _LinuxSystemExtractor(_GenericSystemExtractor):
+    """Extracts general system information, including uptime from procfs"""
+
+    def __init__(self):
+        """Initialize the extractor"""
+        super().__init__()
+        # Boot time is fixed, so it is computed from the first uptime read only
+        self._boot_time: Optional[str] = None
+        self._uptime_file = ProcFile('/proc/uptime', 128)
+
+    def close(self) -> None:
+        """Close the persistent /proc/uptime descriptor"""
+        self._uptime_file.close()
+
+    def _extract_uptime(self) -> Dict[str, Any]:
+        """Extract the uptime fields from /proc/uptime"""
+        uptime_seconds = float(self._uptime_file.read().split()[0])
+        if self._boot_time is None:
+            self._boot_time = (
+                datetime.datetime.now() - datetime.timedelta(seconds=uptime_seconds)
+            ).isoformat()
+        return {
+            'uptime_seconds': int(uptime_seconds),
+            'boot_time': self._boot_time
+        }
+
 
-            # Get uptime from /proc/uptime on Linux
-            try:
-                if platform.system() == 'Linux':
-                    with open('/proc/uptime', 'r') as f:
-                        uptime_seconds = float(f.read().split()[0])
-                        system_info['uptime_seconds'] = int(uptime_seconds)
-                        system_info['boot_time'] = (
-                            datetime.datetime.now() - datetime.timedelta(seconds=uptime_seconds)
-                        ).isoformat()
-            except Exception:
-                pass
-
-            return system_info
-        except Exception as e:
-            logger.error(f"Failed to extract system info: {str(e)}")
-            return {}
\ No newline at end of file
+# The platform cannot change at runtime, so pick the implementation once
+SystemExtractor = _LinuxSystemExtractor if IS_LINUX else _GenericSystemExtractor
@@ -0,0 +1,52 @@
+"""
+Fused CPU and memory extractor for monitoring trigger checks
+"""
+
+from typing import Dict, Any, Optional
+import logging
+
+from .base import BaseExtractor
+from .cpu_extractor import CpuExtractor
+from .memory_extractor import MemoryExtractor
+
+logger = logging.getLogger(__name__)
+
+
+class FusedTriggerExtractor(BaseExtractor):
+    """
+    Extracts the CPU and memory sections used by the trigger checks
+
+    /proc/stat and /proc/meminfo are read back to back in one extraction,
+    so a monitoring cycle schedules a single task for its trigger data.
+    """
+
+    def __init__(self, cpu_extractor: Optional[BaseExtractor] = None,
+                 memory_extractor: Optional[BaseExtractor] = None):
+        """
+        Initialize the extractor
+
+        Args:
+            cpu_extractor: CPU extractor to reuse, so its previous /proc/stat
+                sample is shared with other callers
+            memory_extractor: Memory extractor to reuse
+        """
+        super().__init__()
+        self._cpu = cpu_extractor or CpuExtractor()
+        self._memory = memory_extractor or MemoryExtractor()
+
+    def close(self) -> None:
+        """Release the resources held by the wrapped extractors"""
+        self._cpu.close()
+        self._memory.close()
+
+    def invalidate_cache(self) -> None:
+        """Forget the cached values of the wrapped extractors"""
+        self._cpu.invalidate_cache()
+        self._memory.invalidate_cache()
+
+    def extract(self, bulk: Optional[Dict[str, Optional[str]]] = None) -> Dict[str, Any]:
+        """Extract the CPU and memory sections"""
+        return {
+            'cpu': self._cpu.safe_extract(),
+            'memory': self._memory.safe_extract()
+        }
@@ -4,7 +4,7 @@ System monitoring functionality
 
 import time
 import datetime
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, List
 import logging
 import sys
 import os
@@ -13,8 +13,22 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 from stavily_agent_client import StavilyAgentClient, StavilyAgentError
 
+from ..utils.formatting import format_json_line
+
 logger = logging.getLogger(__name__)
 
+# Log entries for the agent are buffered and uploaded together once this
+# many are pending, or once the oldest has waited LOG_FLUSH_INTERVAL seconds
+LOG_BATCH_SIZE = 16
+LOG_FLUSH_INTERVAL = 60
+
+# Line printed before and after each trigger event in the default output
+_TRIGGER_BANNER = "-" * 10 + " TRIGGER EVENT " + "-" * 10
+
+
+# Marks a usage value absent from the data, as opposed to reported as None
+_MISSING = object()
+
 
 class SystemMonitor:
     """Handles system monitoring with threshold-based triggers"""
@@ -30,6 +44,12 @@ class SystemMonitor:
         self.monitor_interval = config.get('monitor_interval', 30)
         self.cpu_trigger = config.get('cpu_trigger_percentage', 0)
         self.mem_trigger = config.get('mem_trigger_percentage', 0)
+        # With both thresholds at 0 no cycle can ever trigger
+        self._any_trigger_enabled = self.cpu_trigger > 0 or self.mem_trigger > 0
+
+        # Log entries waiting to be uploaded to the agent
+        self._log_buffer: List[Dict[str, Any]] = []
+        self._last_log_flush = time.monotonic()
 
         # Initialize agent client
         self.agent_client = None
@@ -38,11 +58,39 @@ class SystemMonitor:
             self.agent_client.connect()
             logger.info("Connected to Stavily agent")
         except Exception as e:
-            raise Exception(f"Failed to connect to agent: {e}")
+            raise RuntimeError(f"Failed to connect to agent: {e}") from e
 
-        logger.debug(f"Initialized SystemMonitor with interval={self.monitor_interval}s, "
-                    f"CPU trigger={self.cpu_trigger}%, Memory trigger={self.mem_trigger}%")
+        logger.debug("Initialized SystemMonitor with interval=%ss, CPU trigger=%s%%, Memory trigger=%s%%",
+                     self.monitor_interval, self.cpu_trigger, self.mem_trigger)
     
+    def _queue_log(self, level: str, message: str, timestamp: str) -> None:
+        """
+        Buffer a log entry for the agent, uploading the batch when it is due
+
+        Args:
+            level: Log level
+            message: Log message
+            timestamp: ISO timestamp of the entry
+        """
+        self._log_buffer.append({
+            "level": level,
+            "message": message,
+            "timestamp": timestamp
+        })
+        if (len(self._log_buffer) >= LOG_BATCH_SIZE
+                or time.monotonic() - self._last_log_flush > LOG_FLUSH_INTERVAL):
+            self._flush_logs()
+
+    def _flush_logs(self) -> None:
+        """Upload all buffered log entries to the agent in one call"""
+        logs, self._log_buffer = self._log_buffer, []
+        self._last_log_flush = time.monotonic()
+        if logs and self.agent_client and self.agent_client.is_connected():
+            try:
+                self.agent_client.upload_logs(logs)
+            except StavilyAgentError as e:
+                logger.warning("Failed to upload %d log entries to agent: %s", len(logs), e)
+
     def should_trigger(self, data: Dict[str, Any]) -> bool:
         """
         Check if CPU or memory usage exceeds trigger thresholds
@@ -53,55 +101,67 @@ class SystemMonitor:
         Returns:
             True if trigger conditions are met
         """
+        if not self._any_trigger_enabled:
+            return False
+
         triggered = False
+        # The monitoring loop always sets the timestamp; only direct callers may omit it
+        timestamp = data.get('timestamp')
 
         # Debug: Log current data extraction
-        logger.debug(f"Checking triggers with data timestamp: {data.get('timestamp', 'unknown')}")
+        logger.debug("Checking triggers with data timestamp: %s", timestamp or 'unknown')
 
         # Check CPU trigger
-        if self.cpu_trigger > 0:
-            if 'cpu' in data and 'cpu_percent' in data['cpu']:
-                cpu_percent = data['cpu']['cpu_percent']
-                if cpu_percent is not None and isinstance(cpu_percent, (int, float)) and cpu_percent > self.cpu_trigger:
-                    logger.info(f"CPU trigger activated: {cpu_percent}% > {self.cpu_trigger}%")
+        cpu_trigger = self.cpu_trigger
+        if cpu_trigger > 0:
+            cpu = data.get('cpu')
+            cpu_percent = cpu.get('cpu_percent', _MISSING) if cpu else _MISSING
+            if cpu_percent is not _MISSING:
+                # None (no sample yet) fails the isinstance check
+                if isinstance(cpu_percent, (int, float)) and cpu_percent > cpu_trigger:
+                    logger.info("CPU trigger activated: %s%% > %s%%", cpu_percent, cpu_trigger)
 
                     # Report trigger to agent
                     if self.agent_client and self.agent_client.is_connected():
                         try:
                             self.agent_client.report_trigger("cpu_high", {
                                 "usage": cpu_percent,
-                                "threshold": self.cpu_trigger,
-                                "timestamp": data.get('timestamp', datetime.datetime.now().isoformat())
+                                "threshold": cpu_trigger,
+                                "timestamp": timestamp or datetime.datetime.now().isoformat()
                             })
                         except StavilyAgentError as e:
-                            logger.warning(f"Failed to report CPU trigger to agent: {e}")
+                            logger.warning("Failed to report CPU trigger to agent: %s", e)
 
                     triggered = True
             else:
                 logger.warning("CPU data not available for trigger check - this should not happen in monitoring mode")
-                logger.debug(f"Available data keys: {list(data.keys())}")
-                if 'cpu' in data:
-                    logger.debug(f"CPU data content: {data['cpu']}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Available data keys: %s", list(data.keys()))
+                    if cpu is not None:
+                        logger.debug("CPU data content: %s", cpu)
         else:
             logger.debug("CPU trigger disabled (threshold = 0)")
 
         # Check memory trigger
-        if self.mem_trigger > 0:
-            if 'memory' in data and 'virtual_memory' in data['memory'] and 'percent' in data['memory']['virtual_memory']:
-                mem_percent = data['memory']['virtual_memory']['percent']
-                if mem_percent is not None and mem_percent > self.mem_trigger:
-                    logger.info(f"Memory trigger activated: {mem_percent}% > {self.mem_trigger}%")
+        mem_trigger = self.mem_trigger
+        if mem_trigger > 0:
+            memory = data.get('memory')
+            virtual_memory = memory.get('virtual_memory') if memory else None
+            mem_percent = virtual_memory.get('percent', _MISSING) if virtual_memory else _MISSING
+            if mem_percent is not _MISSING:
+                if mem_percent is not None and mem_percent > mem_trigger:
+                    logger.info("Memory trigger activated: %s%% > %s%%", mem_percent, mem_trigger)
 
                     # Report trigger to agent
                     if self.agent_client and self.agent_client.is_connected():
                         try:
                             self.agent_client.report_trigger("memory_high", {
                                 "usage": mem_percent,
-                                "threshold": self.mem_trigger,
-                                "timestamp": data.get('timestamp', datetime.datetime.now().isoformat())
+                                "threshold": mem_trigger,
+                                "timestamp": timestamp or datetime.datetime.now().isoformat()
                             })
                         except StavilyAgentError as e:
-                            logger.warning(f"Failed to report memory trigger to agent: {e}")
+                            logger.warning("Failed to report memory trigger to agent: %s", e)
 
                     triggered = True
             else:
@@ -109,7 +169,7 @@ class SystemMonitor:
         else:
             logger.debug("Memory trigger disabled (threshold = 0)")
 
-        logger.debug(f"Trigger check result: {'TRIGGERED' if triggered else 'no trigger'}")
+        logger.debug("Trigger check result: %s", 'TRIGGERED' if triggered else 'no trigger')
         return triggered
     
     def output_trigger_event(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -137,84 +197,89 @@ class SystemMonitor:
             data_extractor: Function to extract system data
             trigger_callback: Optional callback for trigger events
         """
-        logger.info(f"Starting monitoring loop with {self.monitor_interval}s interval")
-        logger.info(f"Monitor configuration: CPU trigger={self.cpu_trigger}%, Memory trigger={self.mem_trigger}%")
+        logger.info("Starting monitoring loop with %ss interval", self.monitor_interval)
+        logger.info("Monitor configuration: CPU trigger=%s%%, Memory trigger=%s%%",
+                    self.cpu_trigger, self.mem_trigger)
+        if not self._any_trigger_enabled and trigger_callback is None:
+            logger.warning("CPU and memory triggers are both disabled, so monitoring will never "
+                           "emit a trigger event")
 
-        # Log monitoring start to agent
-        if self.agent_client and self.agent_client.is_connected():
-            try:
-                self.agent_client.upload_logs([{
-                    "level": "info",
-                    "message": f"Machine Data Extractor monitoring started with CPU trigger={self.cpu_trigger}%, Memory trigger={self.mem_trigger}%",
-                    "timestamp": datetime.datetime.now().isoformat()
-                }])
-            except StavilyAgentError as e:
-                logger.warning(f"Failed to log monitoring start to agent: {e}")
+        # Log monitoring start to agent right away
+        self._queue_log(
+            "info",
+            f"Machine Data Extractor monitoring started with CPU trigger={self.cpu_trigger}%, Memory trigger={self.mem_trigger}%",
+            datetime.datetime.now().isoformat()
+        )
+        self._flush_logs()
 
         cycle_count = 0
+        # Cycles are scheduled against a fixed monotonic timeline so extraction
+        # time does not accumulate as drift
+        deadline = time.monotonic()
         try:
             while True:
                 cycle_count += 1
-                # Extract current data
+                # Extract current data, stamped once for everything this cycle reports
                 data = data_extractor()
+                timestamp = data.get('timestamp')
+                if timestamp is None:
+                    timestamp = data['timestamp'] = datetime.datetime.now().isoformat()
 
-                # Upload periodic monitoring data to agent
-                if self.agent_client and self.agent_client.is_connected():
-                    try:
-                        cpu_usage = data.get('cpu', {}).get('cpu_percent', 'unknown')
-                        mem_usage = data.get('memory', {}).get('virtual_memory', {}).get('percent', 'unknown')
-                        self.agent_client.upload_logs([{
-                            "level": "info",
-                            "message": f"Monitoring cycle #{cycle_count}: CPU={cpu_usage}%, Memory={mem_usage}%",
-                            "timestamp": data.get('timestamp', datetime.datetime.now().isoformat())
-                        }])
-                    except StavilyAgentError as e:
-                        logger.warning(f"Failed to upload monitoring data to agent: {e}")
+                # Queue periodic monitoring data for the agent
+                cpu_usage = data.get('cpu', {}).get('cpu_percent', 'unknown')
+                mem_usage = data.get('memory', {}).get('virtual_memory', {}).get('percent', 'unknown')
+                self._queue_log(
+                    "info",
+                    f"Monitoring cycle #{cycle_count}: CPU={cpu_usage}%, Memory={mem_usage}%",
+                    timestamp
+                )
 
                 # Check if we should trigger
                 trigger_result = self.should_trigger(data)
                 if trigger_result:
-                    logger.info(f"Trigger conditions met in cycle #{cycle_count}")
+                    logger.info("Trigger conditions met in cycle #%d", cycle_count)
                     trigger_event = self.output_trigger_event(data)
                     if trigger_callback:
                         trigger_callback(trigger_event)
                     else:
-                        # Default behavior: print JSON
-                        import json
-                        encloser = "-" * 10 + " TRIGGER EVENT "+ "-" * 10
-                        print(encloser)
-                        print(json.dumps(trigger_event, indent=2))
-                        print(encloser)
+                        # Default behavior: print the event as one compact JSON line,
+                        # written and flushed at once so nothing is held between cycles
+                        event_line = format_json_line(trigger_event)
+                        sys.stdout.write(f"{_TRIGGER_BANNER}\n{event_line}\n{_TRIGGER_BANNER}\n")
+                        sys.stdout.flush()
 
                 # Wait for next cycle
-                time.sleep(self.monitor_interval)
+                deadline += self.monitor_interval
+                delay = deadline - time.monotonic()
+                if delay < 0:
+                    logger.warning("Monitoring cycle #%d overran the interval by %.0fms",
+                                   cycle_count, -delay * 1000)
+                    deadline = time.monotonic()
+                else:
+                    time.sleep(delay)
 
         except KeyboardInterrupt:
-            logger.info(f"Monitoring stopped by user after {cycle_count} cycles")
-
-            # Log monitoring stop to agent
-            if self.agent_client and self.agent_client.is_connected():
-                try:
-                    self.agent_client.upload_logs([{
-                        "level": "info",
-                        "message": f"Machine Data Extractor monitoring stopped after {cycle_count} cycles",
-                        "timestamp": datetime.datetime.now().isoformat()
-                    }])
-                except StavilyAgentError as e:
-                    logger.warning(f"Failed to log monitoring stop to agent: {e}")
+            logger.info("Monitoring stopped by user after %d cycles", cycle_count)
+
+            # Log monitoring stop to agent, along with any pending entries
+            self._queue_log(
+                "info",
+                f"Machine Data Extractor monitoring stopped after {cycle_count} cycles",
+                datetime.datetime.now().isoformat()
+            )
+            self._flush_logs()
+            self.agent_client.disconnect()
 
         except Exception as e:
-            logger.error(f"Monitoring loop error after {cycle_count} cycles: {str(e)}")
-
-            # Log error to agent
-            if self.agent_client and self.agent_client.is_connected():
-                try:
-                    self.agent_client.upload_logs([{
-                        "level": "ERROR",
-                        "message": f"Machine Data Extractor monitoring error after {cycle_count} cycles: {str(e)}",
-                        "timestamp": datetime.datetime.now().isoformat()
-                    }])
-                except StavilyAgentError as e:
-                    logger.warning(f"Failed to log monitoring error to agent: {e}")
+            logger.error("Monitoring loop error after %d cycles: %s", cycle_count, e)
+
+            # Log error to agent, along with any pending entries
+            self._queue_log(
+                "ERROR",
+                f"Machine Data Extractor monitoring error after {cycle_count} cycles: {str(e)}",
+                datetime.datetime.now().isoformat()
+            )
+            self._flush_logs()
+            self.agent_client.disconnect()
 
             raise
\ No newline at end of file
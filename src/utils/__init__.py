@@ -3,7 +3,7 @@ Utility modules for the machine data extractor
 """
 
 from .validation import validate_monitor_args, validate_monitor_interval, validate_config, ValidationError
-from .formatting import format_success_output, format_error_output, format_trigger_event
+from .formatting import format_success_output, format_error_output, format_trigger_event, format_json_line
 
 __all__ = [
     'validate_monitor_args',
@@ -12,5 +12,6 @@ __all__ = [
     'ValidationError',
     'format_success_output',
     'format_error_output',
-    'format_trigger_event'
+    'format_trigger_event',
+    'format_json_line'
 ]
\ No newline at end of file
@@ -3,11 +3,62 @@ Output formatting utilities
 """
 
 import json
+import os
+import datetime
 from typing import Dict, Any
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Set MACHINE_DATA_EXTRACTOR_PRETTY=1 to indent the JSON output
+PRETTY_OUTPUT = os.environ.get('MACHINE_DATA_EXTRACTOR_PRETTY', '').lower() in ('1', 'true', 'yes')
+
+# Standard library encoders, built once instead of on every json.dumps call.
+# Extracted data is a plain tree, so the circular reference check is skipped,
+# and non-ASCII text is kept as is, like orjson does.
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, check_circular=False)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, check_circular=False)
+
+# Non-string keys are converted like the standard library does instead of rejected
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _dumps(obj: Any) -> str:
+    """
+    Serialize an object to JSON, compact unless pretty output is enabled
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON formatted string
+    """
+    if not PRETTY_OUTPUT:
+        return format_json_line(obj)
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2).decode()
+    return _PRETTY_ENCODER.encode(obj)
+
+
+def format_json_line(obj: Any) -> str:
+    """
+    Serialize an object to a single compact JSON line, whatever the pretty setting
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON formatted string without newlines
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+    return _COMPACT_ENCODER.encode(obj)
+
 
 def format_success_output(data: Dict[str, Any]) -> str:
     """
@@ -23,7 +74,7 @@ def format_success_output(data: Dict[str, Any]) -> str:
         'status': 'success',
         'data': data
     }
-    return json.dumps(output, indent=2)
+    return _dumps(output)
 
 
 def format_error_output(message: str) -> str:
@@ -40,7 +91,7 @@ def format_error_output(message: str) -> str:
         'status': 'error',
         'message': message
     }
-    return json.dumps(output)
+    return _dumps(output)
 
 
 def format_trigger_event(data: Dict[str, Any]) -> str:
@@ -53,9 +104,8 @@ def format_trigger_event(data: Dict[str, Any]) -> str:
     Returns:
         JSON formatted string
     """
-    import datetime
     trigger_output = {
         'data': data,
         'date_triggered': datetime.datetime.now().isoformat()
     }
-    return json.dumps(trigger_output, indent=2)
\ No newline at end of file
+    return _dumps(trigger_output)
\ No newline at end of file
@@ -24,9 +24,9 @@ def validate_monitor_args(cpu_trigger: int, mem_trigger: int) -> None:
     Raises:
         ValidationError: If validation fails
     """
-    if cpu_trigger < 0 or cpu_trigger > 100:
+    if not 0 <= cpu_trigger <= 100:
         raise ValidationError("CPU trigger percentage must be between 0 and 100")
-    if mem_trigger < 0 or mem_trigger > 100:
+    if not 0 <= mem_trigger <= 100:
         raise ValidationError("Memory trigger percentage must be between 0 and 100")
 
 
@@ -12,6 +12,7 @@ Features:
 - Structured logging and error handling
 - High-level methods for common operations
 - Thread-safe operations
+- Asyncio client running concurrent calls over one connection
 - Comprehensive error handling with custom exceptions
 
 Usage:
@@ -34,17 +35,90 @@ Usage:
 """
 
 import os
+import asyncio
 import socket
 import json
 import time
 import logging
-from typing import Dict, Any, List, Optional, Union
+import threading
+import atexit
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fields every uploaded log entry must have
+_REQUIRED_LOG_KEYS = frozenset(('level', 'message', 'timestamp'))
+
+# Initial size of the receive buffer; it grows for longer responses
+_RECV_BUFFER_SIZE = 65536
+
+# Longest response line the asyncio client accepts
+_ASYNC_LINE_LIMIT = 16 * 1024 * 1024
+
+# Buffers passed to one sendmsg call, within the usual IOV_MAX of 1024
+_MAX_IOVECS = 1024
+
+# Encoded request prefix up to the id, by method name
+_REQUEST_PREFIXES: Dict[str, bytes] = {}
+
+# Fallback request encoder; compact and UTF-8 like orjson's output
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a JSON-RPC message to UTF-8 bytes, preferring orjson."""
+    if orjson is not None:
+        # Non-string keys are converted like json.dumps does instead of rejected
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return _JSON_ENCODER.encode(obj).encode()
+
+
+def _encode_request(method: str, params: Optional[Dict[str, Any]], request_id: int) -> bytes:
+    """Encode a JSON-RPC request, without the newline terminator."""
+    return _encode_preserialized(method, _dumps(params) if params else None, request_id)
+
+
+def _encode_preserialized(method: str, params_json: Optional[bytes], request_id: int) -> bytes:
+    """
+    Encode a JSON-RPC request around already serialized parameters.
+
+    The envelope only differs by method and ID, so its encoded prefix is
+    cached per method and the ID and parameters are spliced onto it; the
+    parameters are never walked a second time as part of a request dict.
+
+    Args:
+        method: RPC method name.
+        params_json: Serialized parameters, or None for no parameters.
+        request_id: Request ID.
+
+    Returns:
+        Encoded request, without the newline terminator.
+    """
+    prefix = _REQUEST_PREFIXES.get(method)
+    if prefix is None:
+        # Drop the closing brace so the id can be appended
+        prefix = _dumps({"jsonrpc": "2.0", "method": method})[:-1] + b',"id":'
+        _REQUEST_PREFIXES[method] = prefix
+    if params_json is None:
+        return b"%b%d}" % (prefix, request_id)
+    return b"%b%d,\"params\":%b}" % (prefix, request_id, params_json)
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON-RPC response line, preferring orjson."""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class StavilyAgentError(Exception):
     """Base exception for Stavily agent communication errors."""
@@ -71,13 +145,73 @@ class TimeoutError(StavilyAgentError):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class AgentInfo:
     """Agent information structure."""
+    # Declared by hand, dataclass(slots=True) needs Python 3.10
+    __slots__ = ('agent_id', 'version', 'environment')
+
     agent_id: str
     version: str
     environment: str
 
+    # Without a __dict__, copy and pickle restore the slots with setattr,
+    # which the frozen dataclass rejects
+    def __getstate__(self) -> Tuple[str, str, str]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[str, str, str]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+def _upload_logs_params(logs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Validate log entries and build the upload_logs parameters.
+
+    Raises:
+        ValueError: If an entry is missing a required field.
+    """
+    # Validate log format
+    for log_entry in logs:
+        if not _REQUIRED_LOG_KEYS <= log_entry.keys():
+            raise ValueError("Log entries must contain 'level', 'message', and 'timestamp' fields")
+
+    params = {"logs": logs}
+
+    # Include instruction_id if available in environment
+    instruction_id = os.environ.get("STAVILY_INSTRUCTION_ID")
+    if instruction_id:
+        params["instruction_id"] = instruction_id
+
+    return params
+
+
+def _agent_info(result: Dict[str, Any]) -> AgentInfo:
+    """Build AgentInfo from a get_agent_info result."""
+    return AgentInfo(
+        agent_id=result.get("agent_id", "unknown"),
+        version=result.get("version", "unknown"),
+        environment=result.get("environment", "unknown")
+    )
+
+
+def _responses_match(responses: List[Any], request_ids: List[int]) -> bool:
+    """Check there is exactly one response object for each request ID, in any order."""
+    try:
+        return sorted(response["id"] for response in responses) == sorted(request_ids)
+    except (KeyError, TypeError):
+        # Not an object, no id, or an id that isn't comparable to the request IDs
+        return False
+
+
+def _response_result(response: Dict[str, Any]) -> Any:
+    """Return the result of a JSON-RPC response, raising RPCError for errors."""
+    if "error" in response:
+        error = response["error"]
+        raise RPCError(error["code"], error["message"], error.get("data"))
+    return response.get("result")
+
 
 class StavilyAgentClient:
     """
@@ -92,7 +226,8 @@ class StavilyAgentClient:
                  socket_path: Optional[str] = None,
                  timeout: float = 5.0,
                  max_retries: int = 3,
-                 retry_delay: float = 1.0):
+                 retry_delay: float = 1.0,
+                 seqpacket: bool = False):
         """
         Initialize the agent client.
 
@@ -101,6 +236,10 @@ class StavilyAgentClient:
             timeout: Socket timeout in seconds.
             max_retries: Maximum number of connection retries.
             retry_delay: Delay between retries in seconds.
+            seqpacket: Connect with SOCK_SEQPACKET, sending each request and
+                receiving each response as one message without newline
+                framing. The agent must listen on a SOCK_SEQPACKET socket,
+                and a request must fit in the socket send buffer.
         """
         self.socket_path = socket_path or os.environ.get('STAVILY_AGENT_SOCKET')
         if not self.socket_path:
@@ -109,10 +248,23 @@ class StavilyAgentClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.seqpacket = seqpacket
         self._request_id = 0
         self._connected = False
-
-        logger.debug(f"Initialized StavilyAgentClient with socket: {self.socket_path}")
+        # Connection reused by every call; opened lazily and reopened after
+        # the agent drops it. The lock keeps one request/response in flight.
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+        # Receive buffer reused by every call; bytes between _recv_start and
+        # _recv_end were received but not yet returned as a response line
+        self._recv_buf = bytearray(_RECV_BUFFER_SIZE)
+        self._recv_start = 0
+        self._recv_end = 0
+        # Bytes of the current requests written to the socket, so a failed
+        # send is only retried when the agent can't have seen any of them
+        self._bytes_sent = 0
+
+        logger.debug("Initialized StavilyAgentClient with socket: %s", self.socket_path)
 
     def connect(self) -> None:
         """
@@ -135,15 +287,17 @@ class StavilyAgentClient:
             except Exception as e:
                 last_error = e
                 if attempt < self.max_retries:
-                    logger.warning(f"Connection attempt {attempt + 1} failed: {e}")
+                    logger.warning("Connection attempt %d failed: %s", attempt + 1, e)
                     time.sleep(self.retry_delay)
                 else:
-                    logger.error(f"All connection attempts failed: {e}")
+                    logger.error("All connection attempts failed: %s", e)
 
         raise ConnectionError(f"Failed to connect to agent after {self.max_retries + 1} attempts: {last_error}")
 
     def disconnect(self) -> None:
         """Disconnect from the agent."""
+        with self._lock:
+            self._close_socket()
         self._connected = False
         logger.debug("Disconnected from Stavily agent")
 
@@ -175,7 +329,7 @@ class StavilyAgentClient:
         }
 
         result = self._call("report_trigger", params)
-        logger.debug(f"Reported trigger '{trigger_name}' to agent")
+        logger.debug("Reported trigger '%s' to agent", trigger_name)
         return result
 
     def upload_logs(self, logs: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -195,22 +349,11 @@ class StavilyAgentClient:
         if not self._connected:
             raise ConnectionError("Not connected to agent")
 
-        # Validate log format
-        for log_entry in logs:
-            if not all(key in log_entry for key in ['level', 'message', 'timestamp']):
-                raise ValueError("Log entries must contain 'level', 'message', and 'timestamp' fields")
-
-        params = {"logs": logs}
-
-        # Include instruction_id if available in environment
-        instruction_id = os.environ.get("STAVILY_INSTRUCTION_ID")
-        if instruction_id:
-            params["instruction_id"] = instruction_id
-
-        result = self._call("upload_logs", params)
+        params = _upload_logs_params(logs)
+        # The entries are serialized once, straight into the request bytes
+        result = self._call_with_preserialized("upload_logs", _dumps(params))
 
-        log_count = len(logs)
-        logger.debug(f"Uploaded {log_count} log entries to agent")
+        logger.debug("Uploaded %d log entries to agent", len(logs))
         return result
 
     def get_agent_info(self) -> AgentInfo:
@@ -227,12 +370,7 @@ class StavilyAgentClient:
         if not self._connected:
             raise ConnectionError("Not connected to agent")
 
-        result = self._call("get_agent_info")
-        return AgentInfo(
-            agent_id=result.get("agent_id", "unknown"),
-            version=result.get("version", "unknown"),
-            environment=result.get("environment", "unknown")
-        )
+        return _agent_info(self._call("get_agent_info"))
 
     def get_config(self, section: str) -> Dict[str, Any]:
         """
@@ -255,6 +393,42 @@ class StavilyAgentClient:
         result = self._call("get_config", params)
         return result.get("config", {})
 
+    def call_many(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """
+        Make several JSON-RPC calls in one round trip.
+
+        All requests are written to the connection at once and the responses
+        are read back together, so a burst of calls costs one send instead of
+        a send/receive pair per call. Responses are only read once every
+        request is sent, so batches should stay within what the socket
+        buffers hold (a few hundred kilobytes of responses).
+
+        Args:
+            calls: List of (method, params) pairs; params may be None.
+
+        Returns:
+            RPC results, in the same order as the calls.
+
+        Raises:
+            RPCError: If any call returns an error, after all responses are read.
+            ConnectionError: If not connected to agent or socket communication fails.
+            TimeoutError: If the calls time out.
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to agent")
+        if not calls:
+            return []
+
+        request_ids = [self._get_next_request_id() for _ in calls]
+        responses = self._transact(
+            [_encode_request(method, params, request_id)
+             for (method, params), request_id in zip(calls, request_ids)],
+            request_ids, f"batch of {len(calls)} calls")
+
+        # Match responses by id rather than trusting the agent to keep order
+        by_id = {response["id"]: response for response in responses}
+        return [_response_result(by_id[request_id]) for request_id in request_ids]
+
     def _get_next_request_id(self) -> int:
         """Get next unique request ID."""
         self._request_id += 1
@@ -276,53 +450,221 @@ class StavilyAgentClient:
             ConnectionError: If socket communication fails.
             TimeoutError: If the call times out.
         """
-        request = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "id": self._get_next_request_id()
-        }
+        return self._call_with_preserialized(method, _dumps(params) if params else None)
 
-        if params:
-            request["params"] = params
+    def _call_with_preserialized(self, method: str, params_json: Optional[bytes]) -> Any:
+        """
+        Make a JSON-RPC call with parameters that are already serialized.
 
-        request_json = json.dumps(request)
+        Args:
+            method: RPC method name.
+            params_json: Serialized parameters, or None for no parameters.
+
+        Returns:
+            RPC result.
 
+        Raises:
+            RPCError: If the RPC call returns an error.
+            ConnectionError: If socket communication fails.
+            TimeoutError: If the call times out.
+        """
+        request_id = self._get_next_request_id()
+        request = _encode_preserialized(method, params_json, request_id)
+        response, = self._transact([request], [request_id], f"'{method}'")
+        return _response_result(response)
+
+    def _transact(self, requests: List[bytes], request_ids: List[int],
+                  description: str) -> List[Dict[str, Any]]:
+        """
+        Send requests on the persistent connection and read one response per request.
+
+        Args:
+            requests: Encoded JSON-RPC requests, without the newline terminator.
+            request_ids: IDs of the requests, which the responses must answer.
+            description: What is being called, for error messages.
+
+        Returns:
+            Decoded responses, in the order they arrived.
+
+        Raises:
+            ConnectionError: If socket communication fails.
+            TimeoutError: If the call times out.
+            StavilyAgentError: If the responses are invalid or don't answer the requests.
+        """
         try:
-            # Create socket connection
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
+            with self._lock:
+                # A send failing on a reused connection usually means the agent
+                # closed it while idle, so retry once on a fresh one. Requests
+                # are only resent if none of them went out: the agent may act
+                # on any request already written, so that failure is raised.
+                attempts = 2 if self._sock is not None else 1
+                for attempt in range(attempts):
+                    try:
+                        self._send_requests(requests)
+                        break
+                    except socket.timeout:
+                        self._close_socket()
+                        raise
+                    except socket.error:
+                        self._close_socket()
+                        if attempt + 1 == attempts or self._bytes_sent:
+                            raise
+                        logger.debug("Reconnecting to agent for RPC call to %s", description)
+
+                try:
+                    if self.seqpacket:
+                        lines = [self._read_message() for _ in requests]
+                    else:
+                        lines = [self._read_line() for _ in requests]
+                    responses = [_loads(line) for line in lines]
+                except (socket.error, json.JSONDecodeError):
+                    # Includes timeouts: a late response would be read as the
+                    # answer to the next call
+                    self._close_socket()
+                    raise
+                if not _responses_match(responses, request_ids):
+                    # A stray or missing response would shift every later
+                    # call on this connection onto the wrong answer
+                    self._close_socket()
+                    raise StavilyAgentError(
+                        f"Responses from agent do not match the request IDs of {description}")
+
+            return responses
+
+        except socket.timeout:
+            raise TimeoutError(f"RPC call to {description} timed out after {self.timeout}s")
+        except socket.error as e:
+            raise ConnectionError(f"Socket error during RPC call to {description}: {e}")
+        except json.JSONDecodeError as e:
+            raise StavilyAgentError(f"Invalid JSON response from agent: {e}")
+
+    def _send_requests(self, requests: List[bytes]) -> None:
+        """
+        Send encoded requests, opening the connection if needed.
 
+        Must be called with the lock held.
+
+        Args:
+            requests: Encoded requests, without the newline terminator.
+
+        Raises:
+            socket.error: If connecting or sending fails.
+        """
+        self._bytes_sent = 0
+        if self._sock is None:
+            sock_type = socket.SOCK_SEQPACKET if self.seqpacket else socket.SOCK_STREAM
+            sock = socket.socket(socket.AF_UNIX, sock_type)
+            sock.settimeout(self.timeout)
             try:
                 sock.connect(self.socket_path)
+            except BaseException:
+                sock.close()
+                raise
+            self._sock = sock
+
+        if self.seqpacket:
+            # Message boundaries are kept by the socket; each send is one
+            # whole message, never a partial write
+            for request in requests:
+                self._bytes_sent += self._sock.send(request)
+            return
 
-                # Send request
-                sock.sendall((request_json + "\n").encode())
-
-                # Read response
-                response_data = sock.recv(65536).decode().strip()
+        # Each request and its terminator go out as separate iovecs, so no
+        # concatenated copy of the encoded requests is built
+        buffers = []
+        for request in requests:
+            buffers.append(request)
+            buffers.append(b"\n")
+        self._send_buffers(buffers)
 
-                if not response_data:
-                    raise ConnectionError("Empty response from agent")
+    def _send_buffers(self, buffers: List[bytes]) -> None:
+        """
+        Send all buffers with scatter-gather writes. Must be called with the lock held.
 
-                response = json.loads(response_data)
+        Args:
+            buffers: Byte strings to send in order; the list is consumed.
+        """
+        first = 0
+        while first < len(buffers):
+            sent = self._sock.sendmsg(buffers[first:first + _MAX_IOVECS])
+            self._bytes_sent += sent
+            # Skip the buffers sent in full and trim a partially sent one
+            while first < len(buffers) and sent >= len(buffers[first]):
+                sent -= len(buffers[first])
+                first += 1
+            if sent:
+                buffers[first] = memoryview(buffers[first])[sent:]
+
+    def _read_line(self) -> bytes:
+        """
+        Read one newline-terminated response. Must be called with the lock held.
 
-                # Check for RPC error
-                if "error" in response:
-                    error = response["error"]
-                    raise RPCError(error["code"], error["message"], error.get("data"))
+        Data is received straight into the persistent buffer, so a response
+        of any length is returned whole and no chunk is allocated per recv.
+        """
+        buf = self._recv_buf
+        search_from = self._recv_start
+        while True:
+            end = buf.find(b"\n", search_from, self._recv_end)
+            if end >= 0:
+                with memoryview(buf) as view:
+                    line = bytes(view[self._recv_start:end])
+                if end + 1 == self._recv_end:
+                    self._recv_start = self._recv_end = 0
+                    if len(buf) > _RECV_BUFFER_SIZE:
+                        # Drained; don't hold a large response's allocation
+                        # for the life of the connection
+                        del buf[_RECV_BUFFER_SIZE:]
+                else:
+                    self._recv_start = end + 1
+                return line
+
+            search_from = self._recv_end
+            if self._recv_end == len(buf):
+                if self._recv_start > 0:
+                    # Move the partial line to the front to make room
+                    pending = self._recv_end - self._recv_start
+                    buf[:pending] = buf[self._recv_start:self._recv_end]
+                    self._recv_start, self._recv_end = 0, pending
+                    search_from = pending
+                else:
+                    buf.extend(bytes(len(buf)))
 
-                # Return result
-                return response.get("result")
+            with memoryview(buf) as view:
+                received = self._sock.recv_into(view[self._recv_end:])
+            if not received:
+                raise ConnectionResetError("Empty response from agent")
+            self._recv_end += received
 
-            finally:
-                sock.close()
+    def _read_message(self) -> bytes:
+        """
+        Read one SOCK_SEQPACKET response. Must be called with the lock held.
 
-        except socket.timeout:
-            raise TimeoutError(f"RPC call to '{method}' timed out after {self.timeout}s")
-        except socket.error as e:
-            raise ConnectionError(f"Socket error during RPC call to '{method}': {e}")
-        except json.JSONDecodeError as e:
-            raise StavilyAgentError(f"Invalid JSON response from agent: {e}")
+        The message length is peeked first, so the receive buffer can be
+        grown before a response longer than it is consumed.
+        """
+        # With MSG_PEEK | MSG_TRUNC the full length of the next message is
+        # returned while only its first byte is copied and none is consumed
+        size = self._sock.recv_into(self._recv_buf, 1, socket.MSG_PEEK | socket.MSG_TRUNC)
+        if not size:
+            raise ConnectionResetError("Empty response from agent")
+        if size > len(self._recv_buf):
+            self._recv_buf.extend(bytes(size - len(self._recv_buf)))
+
+        with memoryview(self._recv_buf) as view:
+            received = self._sock.recv_into(view)
+            message = bytes(view[:received])
+        if len(self._recv_buf) > _RECV_BUFFER_SIZE:
+            del self._recv_buf[_RECV_BUFFER_SIZE:]
+        return message
+
+    def _close_socket(self) -> None:
+        """Close the persistent connection, if open. Must be called with the lock held."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        # Whatever was buffered belonged to the closed connection
+        self._recv_start = self._recv_end = 0
 
     @contextmanager
     def session(self):
@@ -338,7 +680,320 @@ class StavilyAgentClient:
             self.disconnect()
 
 
-# Convenience functions for quick operations
+class AsyncStavilyAgentClient:
+    """
+    Asyncio client for communicating with Stavily agents via JSON-RPC over Unix sockets.
+
+    Concurrent calls share one connection: each request is written as soon as
+    it is made and a single reader task hands every response to the call
+    waiting on its request ID, so a slow call does not hold up the others.
+    The methods mirror StavilyAgentClient as coroutines.
+    """
+
+    def __init__(self,
+                 socket_path: Optional[str] = None,
+                 timeout: float = 5.0,
+                 max_retries: int = 3,
+                 retry_delay: float = 1.0):
+        """
+        Initialize the agent client.
+
+        Args:
+            socket_path: Path to the agent socket. If None, uses STAVILY_AGENT_SOCKET env var.
+            timeout: Timeout for each RPC call in seconds.
+            max_retries: Maximum number of connection retries.
+            retry_delay: Delay between retries in seconds.
+        """
+        self.socket_path = socket_path or os.environ.get('STAVILY_AGENT_SOCKET')
+        if not self.socket_path:
+            raise ValueError("Socket path not provided and STAVILY_AGENT_SOCKET not set")
+
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._request_id = 0
+        self._connected = False
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        # Request ID -> future resolved with the response by the reader task
+        self._pending: Dict[int, asyncio.Future] = {}
+        # Created on first use so it belongs to the running event loop
+        self._open_lock: Optional[asyncio.Lock] = None
+
+        logger.debug("Initialized AsyncStavilyAgentClient with socket: %s", self.socket_path)
+
+    async def connect(self) -> None:
+        """
+        Establish connection to the agent.
+
+        Raises:
+            ConnectionError: If connection fails after all retries.
+        """
+        if self._connected:
+            return
+
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                # Test connection with a ping
+                await self._call("ping", {})
+                self._connected = True
+                logger.info("Successfully connected to Stavily agent")
+                return
+            except Exception as e:
+                last_error = e
+                if attempt < self.max_retries:
+                    logger.warning("Connection attempt %d failed: %s", attempt + 1, e)
+                    await asyncio.sleep(self.retry_delay)
+                else:
+                    logger.error("All connection attempts failed: %s", e)
+
+        raise ConnectionError(f"Failed to connect to agent after {self.max_retries + 1} attempts: {last_error}")
+
+    async def disconnect(self) -> None:
+        """Disconnect from the agent."""
+        self._connected = False
+        task = self._reader_task
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        logger.debug("Disconnected from Stavily agent")
+
+    def is_connected(self) -> bool:
+        """Check if client is connected to agent."""
+        return self._connected
+
+    async def report_trigger(self, trigger_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Report a trigger event to the agent.
+
+        See StavilyAgentClient.report_trigger.
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to agent")
+
+        params = {
+            "trigger_name": trigger_name,
+            "payload": payload
+        }
+
+        result = await self._call("report_trigger", params)
+        logger.debug("Reported trigger '%s' to agent", trigger_name)
+        return result
+
+    async def upload_logs(self, logs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Upload structured logs to the agent.
+
+        See StavilyAgentClient.upload_logs.
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to agent")
+
+        result = await self._call("upload_logs", _upload_logs_params(logs))
+
+        logger.debug("Uploaded %d log entries to agent", len(logs))
+        return result
+
+    async def get_agent_info(self) -> AgentInfo:
+        """
+        Get information about the connected agent.
+
+        See StavilyAgentClient.get_agent_info.
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to agent")
+
+        return _agent_info(await self._call("get_agent_info"))
+
+    async def get_config(self, section: str) -> Dict[str, Any]:
+        """
+        Get configuration section from the agent.
+
+        See StavilyAgentClient.get_config.
+        """
+        if not self._connected:
+            raise ConnectionError("Not connected to agent")
+
+        params = {"section": section}
+        result = await self._call("get_config", params)
+        return result.get("config", {})
+
+    def _get_next_request_id(self) -> int:
+        """Get next unique request ID."""
+        self._request_id += 1
+        return self._request_id
+
+    async def _call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Make a JSON-RPC call to the agent.
+
+        Args:
+            method: RPC method name.
+            params: Method parameters.
+
+        Returns:
+            RPC result.
+
+        Raises:
+            RPCError: If the RPC call returns an error.
+            ConnectionError: If socket communication fails.
+            TimeoutError: If the call times out.
+        """
+        request_id = self._get_next_request_id()
+        request = _encode_request(method, params, request_id)
+
+        try:
+            response = await asyncio.wait_for(self._send_and_wait(request_id, request), self.timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"RPC call to '{method}' timed out after {self.timeout}s")
+        except OSError as e:
+            raise ConnectionError(f"Socket error during RPC call to '{method}': {e}")
+
+        return _response_result(response)
+
+    async def _send_and_wait(self, request_id: int, request: bytes) -> Dict[str, Any]:
+        """Write an encoded request and wait for the reader task to deliver its response."""
+        writer = await self._open_connection()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            writer.writelines((request, b"\n"))
+            await writer.drain()
+            return await future
+        finally:
+            # Also forgets calls that timed out, so a late response is dropped
+            self._pending.pop(request_id, None)
+
+    async def _open_connection(self) -> asyncio.StreamWriter:
+        """Return the open connection, opening it and its reader task if needed."""
+        if self._open_lock is None:
+            self._open_lock = asyncio.Lock()
+        async with self._open_lock:
+            if self._writer is None:
+                reader, writer = await asyncio.open_unix_connection(
+                    self.socket_path, limit=_ASYNC_LINE_LIMIT)
+                self._writer = writer
+                self._reader_task = asyncio.ensure_future(self._read_responses(reader, writer))
+            return self._writer
+
+    async def _read_responses(self, reader: asyncio.StreamReader,
+                              writer: asyncio.StreamWriter) -> None:
+        """Deliver each response line to the call waiting on its request ID."""
+        error: StavilyAgentError = ConnectionError("Agent closed the connection")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = _loads(line)
+                if not isinstance(response, dict):
+                    error = StavilyAgentError(
+                        "Invalid response from agent: expected a JSON object")
+                    break
+                request_id = response.get("id")
+                if request_id is None:
+                    # An error that can't be matched to a request (e.g. a
+                    # parse error) leaves the stream out of step
+                    error = StavilyAgentError(
+                        f"Agent error without a request ID: {response.get('error')}")
+                    break
+                if not isinstance(request_id, (int, str)):
+                    error = StavilyAgentError(
+                        f"Invalid request ID in agent response: {request_id!r}")
+                    break
+                future = self._pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except json.JSONDecodeError as e:
+            error = StavilyAgentError(f"Invalid JSON response from agent: {e}")
+        except (OSError, ValueError) as e:
+            # ValueError is raised for a response longer than the line limit
+            error = ConnectionError(f"Socket error reading from agent: {e}")
+        finally:
+            # The stream is unusable; fail the calls still waiting on it and
+            # let the next call open a new connection
+            if self._writer is writer:
+                self._writer = None
+                self._reader_task = None
+            writer.close()
+            pending, self._pending = self._pending, {}
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        Async context manager for agent client sessions.
+
+        Automatically connects on enter and disconnects on exit.
+        """
+        try:
+            await self.connect()
+            yield self
+        finally:
+            await self.disconnect()
+
+
+# Connected clients shared by the convenience functions, by socket path
+_CLIENT_POOL: Dict[str, "StavilyAgentClient"] = {}
+_POOL_LOCK = threading.Lock()
+# One lock per socket path, held while that path's client connects, so a
+# slow or failing agent only delays callers of the same path
+_CONNECT_LOCKS: Dict[str, threading.Lock] = {}
+
+
+def _get_pooled_client(socket_path: Optional[str] = None) -> StavilyAgentClient:
+    """
+    Get a connected client from the pool, creating it on first use.
+
+    Clients are only added to the pool once connected; a failed connect is
+    retried by the next call.
+
+    Args:
+        socket_path: Optional socket path override.
+
+    Returns:
+        Connected client for the socket path.
+    """
+    path = socket_path or os.environ.get('STAVILY_AGENT_SOCKET')
+    if not path:
+        raise ValueError("Socket path not provided and STAVILY_AGENT_SOCKET not set")
+
+    with _POOL_LOCK:
+        client = _CLIENT_POOL.get(path)
+        if client is not None:
+            return client
+        connect_lock = _CONNECT_LOCKS.setdefault(path, threading.Lock())
+
+    with connect_lock:
+        # Another caller may have connected while this one waited
+        with _POOL_LOCK:
+            client = _CLIENT_POOL.get(path)
+        if client is None:
+            client = StavilyAgentClient(path)
+            client.connect()
+            with _POOL_LOCK:
+                _CLIENT_POOL[path] = client
+        return client
+
+
+def _close_pool() -> None:
+    """Disconnect and forget all pooled clients."""
+    with _POOL_LOCK:
+        for client in _CLIENT_POOL.values():
+            client.disconnect()
+        _CLIENT_POOL.clear()
+
+
+atexit.register(_close_pool)
+
+
+# Convenience functions for quick operations, sharing one connection per socket
 def quick_report_trigger(trigger_name: str, payload: Dict[str, Any],
                         socket_path: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -352,8 +1007,7 @@ def quick_report_trigger(trigger_name: str, payload: Dict[str, Any],
     Returns:
         Acknowledgment response.
     """
-    with StavilyAgentClient(socket_path).session() as client:
-        return client.report_trigger(trigger_name, payload)
+    return _get_pooled_client(socket_path).report_trigger(trigger_name, payload)
 
 
 def quick_upload_logs(logs: List[Dict[str, Any]],
@@ -368,8 +1022,7 @@ def quick_upload_logs(logs: List[Dict[str, Any]],
     Returns:
         Upload acknowledgment.
     """
-    with StavilyAgentClient(socket_path).session() as client:
-        return client.upload_logs(logs)
+    return _get_pooled_client(socket_path).upload_logs(logs)
 
 
 def quick_get_agent_info(socket_path: Optional[str] = None) -> AgentInfo:
@@ -382,8 +1035,7 @@ def quick_get_agent_info(socket_path: Optional[str] = None) -> AgentInfo:
     Returns:
         Agent information.
     """
-    with StavilyAgentClient(socket_path).session() as client:
-        return client.get_agent_info()
+    return _get_pooled_client(socket_path).get_agent_info()
 
 
 def quick_get_config(section: str, socket_path: Optional[str] = None) -> Dict[str, Any]:
@@ -397,13 +1049,13 @@ def quick_get_config(section: str, socket_path: Optional[str] = None) -> Dict[st
     Returns:
         Configuration data.
     """
-    with StavilyAgentClient(socket_path).session() as client:
-        return client.get_config(section)
+    return _get_pooled_client(socket_path).get_config(section)
 
 
 # Export public API
 __all__ = [
     "StavilyAgentClient",
+    "AsyncStavilyAgentClient",
     "StavilyAgentError",
     "ConnectionError",
     "RPCError",
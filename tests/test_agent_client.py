@@ -0,0 +1,468 @@
+"""
+Tests for the Stavily agent client
+"""
+
+import asyncio
+import copy
+import json
+import os
+import pickle
+import socket
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import stavily_agent_client
+from stavily_agent_client import (StavilyAgentClient, AsyncStavilyAgentClient,
+                                  ConnectionError, RPCError, StavilyAgentError)
+
+
+class FakeAgent:
+    """Minimal JSON-RPC agent on a Unix socket, answering each request line"""
+
+    def __init__(self, close_after_response: bool = False, seqpacket: bool = False):
+        self._dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self._dir.name, 'agent.sock')
+        self.close_after_response = close_after_response
+        self.seqpacket = seqpacket
+        self.connections = 0
+        self.requests = []
+        # Set each time the agent closes a client connection
+        self.closed = threading.Event()
+        self._server = socket.socket(socket.AF_UNIX,
+                                     socket.SOCK_SEQPACKET if seqpacket else socket.SOCK_STREAM)
+        self._server.bind(self.socket_path)
+        self._server.listen(8)
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def close(self):
+        self._server.close()
+        self._dir.cleanup()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        # Delayed answers still due on this connection
+        timers = []
+        try:
+            self._handle_requests(conn, timers)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client hung up without reading every answer
+            pass
+        finally:
+            for timer in timers:
+                timer.cancel()
+            conn.close()
+            self.closed.set()
+
+    def _handle_requests(self, conn, timers):
+        buf = b''
+        while True:
+            data = conn.recv(1 << 20)
+            if not data:
+                return
+            if self.seqpacket:
+                # Each message is one request, without a terminator
+                data += b'\n'
+            buf += data
+            while b'\n' in buf:
+                line, buf = buf.split(b'\n', 1)
+                request = json.loads(line)
+                self.requests.append(request)
+                response = {'jsonrpc': '2.0', 'id': request['id']}
+                if request['method'] == 'fail':
+                    response['error'] = {'code': -32601, 'message': 'Method not found'}
+                elif request['method'] == 'echo':
+                    response['result'] = request['params']
+                elif request['method'] == 'drop':
+                    # Hang up after taking the request, without answering
+                    return
+                elif request['method'] == 'slow':
+                    # Answer later from another thread, after faster calls
+                    timer = threading.Timer(0.2, self._send_late, args=(conn, self._frame(
+                        {'jsonrpc': '2.0', 'id': request['id'], 'result': 'slow'})))
+                    timers.append(timer)
+                    timer.start()
+                    continue
+                elif request['method'] == 'stray':
+                    # Answer for a request that was never made, then this one
+                    conn.sendall(self._frame({'jsonrpc': '2.0', 'id': 999, 'result': 'stray'}))
+                    response['result'] = 'stray'
+                elif request['method'] == 'garbage':
+                    response = ['not', 'an', 'object']
+                elif request['method'] == 'orphan_error':
+                    response = {'jsonrpc': '2.0', 'id': None,
+                                'error': {'code': -32700, 'message': 'Parse error'}}
+                else:
+                    response['result'] = {'method': request['method']}
+                conn.sendall(self._frame(response))
+                if self.close_after_response:
+                    return
+
+    def _send_late(self, conn, data):
+        try:
+            conn.sendall(data)
+        except OSError:
+            # The connection was closed while the timer was firing
+            pass
+
+    def _frame(self, response):
+        encoded = json.dumps(response).encode()
+        return encoded if self.seqpacket else encoded + b'\n'
+
+
+class TestStavilyAgentClient(unittest.TestCase):
+    """Test agent client communication"""
+
+    def _client(self, **kwargs):
+        agent = FakeAgent(**kwargs)
+        self.addCleanup(agent.close)
+        client = StavilyAgentClient(agent.socket_path, timeout=2.0, retry_delay=0,
+                                    seqpacket=agent.seqpacket)
+        self.addCleanup(client.disconnect)
+        return agent, client
+
+    def test_connection_reused_between_calls(self):
+        """Test calls share one connection instead of connecting each time"""
+        agent, client = self._client()
+        client.connect()
+        for _ in range(3):
+            client.report_trigger('cpu_high', {'usage': 85})
+
+        self.assertEqual(agent.connections, 1)
+        self.assertEqual([r['method'] for r in agent.requests],
+                         ['ping', 'report_trigger', 'report_trigger', 'report_trigger'])
+
+    def test_reconnects_when_agent_closes_connection(self):
+        """Test a call retries once on a new connection after the agent hangs up"""
+        agent, client = self._client(close_after_response=True)
+        client.connect()
+        self.assertTrue(agent.closed.wait(2))
+        result = client.report_trigger('cpu_high', {'usage': 85})
+
+        self.assertEqual(result, {'method': 'report_trigger'})
+        self.assertEqual(agent.connections, 2)
+
+    def test_no_resend_after_request_was_sent(self):
+        """Test a connection lost after sending is raised instead of resending"""
+        agent, client = self._client()
+        client.connect()
+        with self.assertRaises(ConnectionError):
+            client._call('drop')
+
+        self.assertEqual([r['method'] for r in agent.requests], ['ping', 'drop'])
+        self.assertEqual(client.get_config('plugin'), {})
+
+    def test_unmatched_response_closes_connection(self):
+        """Test a response for another request is raised and not left for the next call"""
+        agent, client = self._client()
+        client.connect()
+        with self.assertRaises(StavilyAgentError):
+            client._call('stray')
+
+        self.assertEqual(client._call('echo', {'n': 1}), {'n': 1})
+        self.assertEqual(agent.connections, 2)
+
+    def test_no_resend_after_partial_batch_send(self):
+        """Test a batch failing after some requests went out is not resent"""
+        agent, client = self._client()
+        client.connect()
+        sock = client._sock
+        sends = []
+
+        def sendmsg(buffers):
+            # The first request and its terminator go out, then the line drops
+            sends.append(buffers)
+            if len(sends) > 1:
+                raise BrokenPipeError()
+            return sock.sendmsg(buffers[:2])
+
+        client._sock = Mock(wraps=sock, sendmsg=sendmsg)
+        with self.assertRaises(ConnectionError):
+            client.call_many([('echo', {'n': 1}), ('echo', {'n': 2})])
+
+        self.assertEqual(len(sends), 2)
+        # Closed without reconnecting to send the batch again
+        self.assertIsNone(client._sock)
+
+    def test_call_many_sends_requests_together(self):
+        """Test a batch of calls is answered in order over the same connection"""
+        agent, client = self._client()
+        client.connect()
+        results = client.call_many([('report_trigger', {'trigger_name': 'cpu_high'}),
+                                    ('get_agent_info', None)])
+
+        self.assertEqual(results, [{'method': 'report_trigger'}, {'method': 'get_agent_info'}])
+        self.assertEqual(agent.connections, 1)
+        self.assertNotIn('params', agent.requests[-1])
+
+    def test_call_many_raises_rpc_error_after_reading_all_responses(self):
+        """Test an error in a batch leaves the connection usable"""
+        agent, client = self._client()
+        client.connect()
+        with self.assertRaises(RPCError):
+            client.call_many([('fail', None), ('get_agent_info', None)])
+
+        self.assertEqual(client.get_config('plugin'), {})
+        self.assertEqual(agent.connections, 1)
+
+    def test_response_larger_than_receive_buffer(self):
+        """Test responses spanning many reads are framed by their newline"""
+        agent, client = self._client()
+        client.connect()
+        big = {'data': 'x' * 200000}
+        results = client.call_many([('echo', big), ('echo', {'data': 'small'}), ('echo', big)])
+
+        self.assertEqual(results, [big, {'data': 'small'}, big])
+        self.assertEqual(client._call('echo', {'data': 'after'}), {'data': 'after'})
+        # The grown buffer is given back once the responses are drained
+        self.assertEqual(len(client._recv_buf), stavily_agent_client._RECV_BUFFER_SIZE)
+
+    def test_call_many_beyond_one_sendmsg(self):
+        """Test batches with more buffers than one sendmsg takes are sent whole"""
+        agent, client = self._client()
+        client.connect()
+        calls = [('echo', {'n': n}) for n in range(600)]
+
+        self.assertEqual(client.call_many(calls), [{'n': n} for n in range(600)])
+
+    def test_request_encoding_matches_without_orjson(self):
+        """Test both JSON backends send the same request"""
+        payload = {'host': 'h\u00f4te', 1: 'int key'}
+        agent, client = self._client()
+        client.connect()
+        client.report_trigger('cpu_high', payload)
+        with patch.object(stavily_agent_client, 'orjson', None):
+            result = client.report_trigger('cpu_high', payload)
+
+        self.assertEqual(result, {'method': 'report_trigger'})
+        self.assertEqual(agent.requests[1]['params'], agent.requests[2]['params'])
+        self.assertEqual(agent.requests[2]['params']['payload'], {'host': 'h\u00f4te', '1': 'int key'})
+
+    def test_parameterless_requests_use_cached_prefix(self):
+        """Test parameterless requests encode the same as a full request"""
+        encoded = stavily_agent_client._encode_request('get_agent_info', None, 7)
+
+        self.assertEqual(json.loads(encoded), {'jsonrpc': '2.0', 'method': 'get_agent_info', 'id': 7})
+        self.assertIn('get_agent_info', stavily_agent_client._REQUEST_PREFIXES)
+        self.assertEqual(json.loads(stavily_agent_client._encode_request('get_agent_info', {}, 8))['id'], 8)
+
+    def test_params_spliced_into_cached_envelope(self):
+        """Test serialized params are spliced into the same request a dict would encode to"""
+        params = {'logs': [{'level': 'INFO', 'message': 'm\u00e9', 'timestamp': 't'}]}
+        encoded = stavily_agent_client._encode_request('upload_logs', params, 3)
+
+        self.assertEqual(json.loads(encoded),
+                         {'jsonrpc': '2.0', 'method': 'upload_logs', 'id': 3, 'params': params})
+
+    def test_agent_info_is_frozen_without_dict(self):
+        """Test AgentInfo is an immutable slotted record"""
+        agent, client = self._client()
+        client.connect()
+        info = client.get_agent_info()
+
+        self.assertEqual(info, stavily_agent_client.AgentInfo('unknown', 'unknown', 'unknown'))
+        self.assertFalse(hasattr(info, '__dict__'))
+        with self.assertRaises(AttributeError):
+            info.version = '2'
+
+    def test_agent_info_copies_and_pickles(self):
+        """Test AgentInfo survives copy, deepcopy and a pickle round trip"""
+        info = stavily_agent_client.AgentInfo('agent-1', '1.2', 'prod')
+
+        self.assertEqual(copy.copy(info), info)
+        self.assertEqual(copy.deepcopy(info), info)
+        self.assertEqual(pickle.loads(pickle.dumps(info)), info)
+
+    def test_upload_logs_requires_log_fields(self):
+        """Test log entries missing a required field are rejected before sending"""
+        agent, client = self._client()
+        client.connect()
+        entry = {'level': 'INFO', 'message': 'started', 'timestamp': '2025-01-01T00:00:00'}
+        client.upload_logs([entry])
+        with self.assertRaises(ValueError):
+            client.upload_logs([entry, {'level': 'INFO', 'message': 'no timestamp'}])
+
+        self.assertEqual([r['method'] for r in agent.requests], ['ping', 'upload_logs'])
+
+    def test_seqpacket_calls_without_framing(self):
+        """Test SOCK_SEQPACKET sends one message per request and response"""
+        agent, client = self._client(seqpacket=True)
+        client.connect()
+        results = client.call_many([('echo', {'n': 1}), ('get_agent_info', None)])
+
+        self.assertEqual(results, [{'n': 1}, {'method': 'get_agent_info'}])
+        self.assertEqual(client.get_agent_info().agent_id, 'unknown')
+        self.assertEqual(agent.connections, 1)
+
+    def test_seqpacket_oversized_response_grows_buffer(self):
+        """Test a SOCK_SEQPACKET response longer than the receive buffer is read whole"""
+        agent, client = self._client(seqpacket=True)
+        client.connect()
+        big = {'data': 'x' * 100000}
+
+        self.assertEqual(client._call('echo', big), big)
+        # Grown for the message, then given back once it was read
+        self.assertEqual(len(client._recv_buf), stavily_agent_client._RECV_BUFFER_SIZE)
+        self.assertEqual(client._call('echo', {'n': 1}), {'n': 1})
+        self.assertEqual(agent.connections, 1)
+
+    def test_disconnect_closes_connection(self):
+        """Test disconnect drops the persistent connection"""
+        agent, client = self._client()
+        client.connect()
+        client.disconnect()
+
+        self.assertFalse(client.is_connected())
+        self.assertIsNone(client._sock)
+
+    def test_connect_fails_without_agent(self):
+        """Test connect raises after its retries when no agent is listening"""
+        client = StavilyAgentClient('/nonexistent/agent.sock', max_retries=1, retry_delay=0)
+
+        with self.assertLogs('stavily_agent_client', level='WARNING'):
+            with self.assertRaises(ConnectionError):
+                client.connect()
+
+
+class TestAsyncStavilyAgentClient(unittest.IsolatedAsyncioTestCase):
+    """Test the asyncio agent client"""
+
+    async def asyncSetUp(self):
+        self.agent = FakeAgent()
+        self.addCleanup(self.agent.close)
+        self.client = AsyncStavilyAgentClient(self.agent.socket_path, timeout=2.0, retry_delay=0)
+        await self.client.connect()
+
+    async def asyncTearDown(self):
+        await self.client.disconnect()
+
+    async def test_concurrent_calls_share_connection(self):
+        """Test concurrent calls run over one connection and get their own responses"""
+        results = await asyncio.gather(self.client._call('slow'),
+                                       self.client._call('echo', {'n': 1}),
+                                       self.client.get_agent_info())
+
+        self.assertEqual(results[0], 'slow')
+        self.assertEqual(results[1], {'n': 1})
+        self.assertEqual(results[2].agent_id, 'unknown')
+        self.assertEqual(self.agent.connections, 1)
+
+    async def test_timeout_drops_late_response(self):
+        """Test a timed out call's late response is not given to the next call"""
+        self.client.timeout = 0.05
+        with self.assertRaises(stavily_agent_client.TimeoutError):
+            await self.client._call('slow')
+        await asyncio.sleep(0.3)
+
+        self.assertEqual(await self.client._call('echo', {'n': 2}), {'n': 2})
+
+    async def test_rpc_error(self):
+        """Test an error response raises RPCError"""
+        with self.assertRaises(RPCError):
+            await self.client._call('fail')
+
+    async def test_non_object_response_fails_pending_calls(self):
+        """Test a response that is not a JSON object fails the waiting calls"""
+        results = await asyncio.gather(self.client._call('slow'),
+                                       self.client._call('garbage'),
+                                       return_exceptions=True)
+
+        for result in results:
+            self.assertIsInstance(result, StavilyAgentError)
+        self.assertEqual(await self.client._call('echo', {'n': 3}), {'n': 3})
+        self.assertEqual(self.agent.connections, 2)
+
+    async def test_error_without_id_fails_pending_calls(self):
+        """Test an error response with a null ID fails the waiting calls"""
+        results = await asyncio.gather(self.client._call('slow'),
+                                       self.client._call('orphan_error'),
+                                       return_exceptions=True)
+
+        for result in results:
+            self.assertIsInstance(result, StavilyAgentError)
+        self.assertEqual(await self.client._call('echo', {'n': 3}), {'n': 3})
+        self.assertEqual(self.agent.connections, 2)
+
+    async def test_reconnects_after_disconnect(self):
+        """Test a new connection is opened after the previous one was closed"""
+        await self.client.disconnect()
+        await self.client.connect()
+        await self.client.report_trigger('cpu_high', {'usage': 85})
+
+        self.assertEqual(self.agent.connections, 2)
+
+
+class TestQuickFunctions(unittest.TestCase):
+    """Test the convenience functions"""
+
+    def setUp(self):
+        self.agent = FakeAgent()
+        self.addCleanup(self.agent.close)
+        self.addCleanup(stavily_agent_client._close_pool)
+
+    def test_quick_calls_share_pooled_connection(self):
+        """Test repeated quick calls reuse one connected client"""
+        for _ in range(3):
+            stavily_agent_client.quick_report_trigger('cpu_high', {'usage': 85},
+                                                       socket_path=self.agent.socket_path)
+        stavily_agent_client.quick_get_config('plugin', socket_path=self.agent.socket_path)
+
+        self.assertEqual(self.agent.connections, 1)
+        self.assertEqual(len(self.agent.requests), 5)
+
+    def test_failed_connect_is_not_pooled(self):
+        """Test a client is only pooled once it has connected"""
+        with patch.object(StavilyAgentClient, 'connect', side_effect=ConnectionError('down')):
+            with self.assertRaises(ConnectionError):
+                stavily_agent_client.quick_get_agent_info(socket_path=self.agent.socket_path)
+
+        self.assertEqual(stavily_agent_client._CLIENT_POOL, {})
+        stavily_agent_client.quick_get_agent_info(socket_path=self.agent.socket_path)
+        self.assertIn(self.agent.socket_path, stavily_agent_client._CLIENT_POOL)
+
+    def test_slow_connect_does_not_block_other_paths(self):
+        """Test connecting to one socket path does not hold up another"""
+        entered, release = threading.Event(), threading.Event()
+        real_connect = StavilyAgentClient.connect
+
+        def connect(client):
+            if client.socket_path == '/slow/agent.sock':
+                entered.set()
+                release.wait(5)
+                raise ConnectionError('down')
+            real_connect(client)
+
+        with patch.object(StavilyAgentClient, 'connect', connect):
+            slow = threading.Thread(target=self.assertRaises, args=(
+                ConnectionError, stavily_agent_client.quick_get_agent_info, '/slow/agent.sock'))
+            slow.start()
+            self.assertTrue(entered.wait(2))
+            try:
+                info = stavily_agent_client.quick_get_agent_info(socket_path=self.agent.socket_path)
+            finally:
+                release.set()
+                slow.join()
+
+        self.assertEqual(info.agent_id, 'unknown')
+
+    def test_close_pool_disconnects_clients(self):
+        """Test closing the pool disconnects its clients"""
+        stavily_agent_client.quick_get_agent_info(socket_path=self.agent.socket_path)
+        client = stavily_agent_client._CLIENT_POOL[self.agent.socket_path]
+        stavily_agent_client._close_pool()
+
+        self.assertFalse(client.is_connected())
+        self.assertEqual(stavily_agent_client._CLIENT_POOL, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
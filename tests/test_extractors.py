@@ -2,6 +2,8 @@
 Tests for data extractors
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, mock_open
 import platform
@@ -11,8 +13,13 @@ from src.extractors import (
     CpuExtractor,
     MemoryExtractor,
     DiskExtractor,
-    ProcessExtractor
+    ProcessExtractor,
+    FusedTriggerExtractor,
+    get_extractor
 )
+from src.extractors import cpu_extractor, memory_extractor, disk_extractor, process_extractor, system_extractor
+from src.extractors.shell_bulk import fetch_bulk, command_output
+from src.extractors.base import ProcFile, IS_LINUX
 
 
 class TestSystemExtractor(unittest.TestCase):
@@ -39,6 +46,7 @@ class TestSystemExtractor(unittest.TestCase):
         mock_processor.return_value = ''
         mock_hostname.return_value = 'test-host'
 
+        # Static fields are captured on the first extraction
         result = self.extractor.extract()
 
         self.assertIn('hostname', result)
@@ -47,87 +55,219 @@ class TestSystemExtractor(unittest.TestCase):
         self.assertEqual(result['hostname'], 'test-host')
         self.assertEqual(result['system'], 'Linux')
 
+    @patch('platform.platform')
+    def test_static_info_is_not_captured_at_init(self, mock_platform):
+        SystemExtractor()
+
+        mock_platform.assert_not_called()
+
+    def test_static_info_is_cached(self):
+        first = self.extractor.extract()
+
+        with patch('platform.platform') as mock_platform:
+            second = self.extractor.extract()
+
+        mock_platform.assert_not_called()
+        self.assertEqual(first['platform'], second['platform'])
+
+    @patch('socket.gethostname', side_effect=['host-a', 'host-b', 'host-c'])
+    def test_hostname_is_refreshed_after_ttl(self, mock_hostname):
+        with patch('time.monotonic', return_value=1000.0):
+            self.assertEqual(self.extractor.extract()['hostname'], 'host-a')
+            self.assertEqual(self.extractor.extract()['hostname'], 'host-a')
+        with patch('time.monotonic', return_value=1000.0 + system_extractor.HOSTNAME_TTL):
+            self.assertEqual(self.extractor.extract()['hostname'], 'host-b')
+            self.extractor.invalidate_cache()
+            self.assertEqual(self.extractor.extract()['hostname'], 'host-c')
+
+
+class TestProcFile(unittest.TestCase):
+    """Test persistent /proc file reader"""
+
+    def test_reread_from_start(self):
+        with tempfile.NamedTemporaryFile('w', delete=False) as f:
+            f.write('first\n')
+        self.addCleanup(os.unlink, f.name)
+        proc_file = ProcFile(f.name)
+        self.addCleanup(proc_file.close)
+
+        self.assertEqual(proc_file.read(), b'first\n')
+        with open(f.name, 'w') as rewritten:
+            rewritten.write('second\n')
+        self.assertEqual(proc_file.read(), b'second\n')
+
+    def test_read_first_line(self):
+        with tempfile.NamedTemporaryFile('w', delete=False) as f:
+            f.write('cpu  1 2 3\ncpu0 1 2 3\n')
+        self.addCleanup(os.unlink, f.name)
+        proc_file = ProcFile(f.name, 64)
+        self.addCleanup(proc_file.close)
+
+        self.assertEqual(proc_file.read_first_line(), b'cpu  1 2 3')
+        with open(f.name, 'w') as rewritten:
+            rewritten.write('cpu  4')
+        self.assertEqual(proc_file.read_first_line(), b'cpu  4')
+
 
 class TestCpuExtractor(unittest.TestCase):
     """Test CPU information extractor"""
 
     def setUp(self):
-        self.extractor = CpuExtractor()
-
-    @patch('os.cpu_count')
-    @patch('platform.system')
-    @patch('builtins.open', new_callable=mock_open, read_data='processor\t: 0\nprocessor\t: 1\n')
-    @patch('subprocess.run')
-    def test_extract_cpu_info(self, mock_subprocess, mock_file, mock_system, mock_cpu_count):
-        mock_cpu_count.return_value = 2
-        mock_system.return_value = 'Linux'
-
-        # Mock subprocess for top command
-        mock_result = unittest.mock.MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = '%Cpu(s):  5.0 us,  2.0 sy,  0.0 ni, 93.0 id,  0.0 wa,  0.0 hi,  0.0 si,  0.0 st\n'
-        mock_subprocess.return_value = mock_result
+        self.extractor = cpu_extractor._LinuxCpuExtractor()
+
+    @patch('time.sleep')
+    @patch('os.sched_getaffinity', return_value={0, 1})
+    @patch.object(ProcFile, 'read_first_line')
+    def test_extract_cpu_info(self, mock_read, mock_affinity, mock_sleep):
+        # Two /proc/stat samples: 100 jiffies elapsed, 93 of them idle
+        mock_read.side_effect = [
+            b'cpu  1000 0 500 8000 0 0 0 0 0 0',
+            b'cpu  1005 0 502 8093 0 0 0 0 0 0'
+        ]
 
         result = self.extractor.extract()
 
         self.assertIn('cpu_count', result)
         self.assertIn('cpu_percent', result)
         self.assertEqual(result['cpu_count'], 2)
+        self.assertEqual(result['cpu_percent'], 7.0)
+
+    @patch('os.sched_getaffinity', return_value={0, 1, 2, 3})
+    @patch.object(ProcFile, 'read_first_line', side_effect=PermissionError('denied'))
+    def test_stat_failure_keeps_cpu_count(self, mock_read, mock_affinity):
+        result = self.extractor.extract()
+
+        self.assertEqual(result, {'cpu_count': 4})
+
+    @patch('os.cpu_count')
+    def test_extract_cpu_info_generic(self, mock_cpu_count):
+        mock_cpu_count.return_value = 4
+
+        # Platforms without sched_getaffinity fall back to os.cpu_count()
+        with patch.object(cpu_extractor.os, 'sched_getaffinity', create=True,
+                          side_effect=AttributeError):
+            result = cpu_extractor._GenericCpuExtractor().extract()
+
+        self.assertEqual(result, {'cpu_count': 4})
 
 
 class TestMemoryExtractor(unittest.TestCase):
     """Test memory information extractor"""
 
     def setUp(self):
-        self.extractor = MemoryExtractor()
-
-    @patch('platform.system')
-    @patch('builtins.open', new_callable=mock_open, read_data='MemTotal:        8192000 kB\nMemFree:         2048000 kB\n')
-    def test_extract_memory_info(self, mock_file, mock_system):
-        mock_system.return_value = 'Linux'
+        self.extractor = memory_extractor._LinuxMemoryExtractor()
 
+    @patch.object(ProcFile, 'read', return_value=b'MemTotal:        8192000 kB\nMemFree:         2048000 kB\n')
+    def test_extract_memory_info(self, mock_read):
         result = self.extractor.extract()
 
         self.assertIn('virtual_memory', result)
         self.assertIn('total', result['virtual_memory'])
         self.assertIn('free', result['virtual_memory'])
+        self.assertEqual(result['virtual_memory']['percent'], 75.0)
+
+    @patch.object(ProcFile, 'read', return_value=(
+        b'MemTotal:        8192000 kB\nSwapCached:         1000 kB\n'
+        b'Cached:           300000 kB\nSwapTotal:        100000 kB'))
+    def test_fields_match_whole_names(self, mock_read):
+        result = self.extractor.extract()
+
+        self.assertEqual(result['virtual_memory']['cached'], 300000 * 1024)
+        self.assertEqual(result['virtual_memory']['swap_cached'], 1000 * 1024)
+        self.assertEqual(result['swap_memory']['total'], 100000 * 1024)
+
+    @patch.object(ProcFile, 'read')
+    def test_total_is_cached_until_invalidated(self, mock_read):
+        mock_read.return_value = b'MemTotal: 8192000 kB\nMemFree: 2048000 kB\n'
+        self.extractor.extract()
+
+        mock_read.return_value = b'MemTotal: 4096000 kB\nMemFree: 2048000 kB\n'
+        self.assertEqual(self.extractor.extract()['virtual_memory']['total'], 8192000 * 1024)
+
+        self.extractor.invalidate_total()
+        self.assertEqual(self.extractor.extract()['virtual_memory']['total'], 4096000 * 1024)
 
 
 class TestDiskExtractor(unittest.TestCase):
     """Test disk information extractor"""
 
-    def setUp(self):
-        self.extractor = DiskExtractor()
+    def _mock_statvfs(self):
+        mock_stat = unittest.mock.MagicMock()
+        mock_stat.f_blocks = 1000000
+        mock_stat.f_frsize = 1024
+        mock_stat.f_bavail = 500000
+        return mock_stat
+
+    @patch('builtins.open', new_callable=mock_open,
+           read_data='/dev/sda1 / ext4 rw,relatime 0 0\n'
+                     'proc /proc proc rw,nosuid 0 0\n'
+                     '/dev/sdb1 /mnt/my\\040data ext4 rw 0 0\n')
+    @patch('os.statvfs')
+    def test_extract_disk_info(self, mock_statvfs, mock_file):
+        mock_statvfs.return_value = self._mock_statvfs()
+
+        result = disk_extractor._LinuxDiskExtractor().extract()
+
+        self.assertIn('partitions', result)
+        self.assertIn('root_usage', result)
+        self.assertEqual([p['mountpoint'] for p in result['partitions']], ['/', '/mnt/my data'])
+        self.assertEqual(result['partitions'][0]['total'], 1024000000)
+        self.assertEqual(result['partitions'][0]['percent'], 50.0)
+        self.assertEqual(result['root_usage']['percent'], 50.0)
+
+    @patch('builtins.open', new_callable=mock_open,
+           read_data='/dev/sda1 / ext4 rw 0 0\n'
+                     'shm /dev/shm tmpfs rw 0 0\n'
+                     '/dev/sdb1 /data ext4 rw 0 0\n'
+                     'tmpfs /dev/shm tmpfs rw 0 0\n'
+                     'proc /data proc rw 0 0\n'
+                     'sysfs /sys sysfs rw 0 0\n')
+    @patch('os.statvfs')
+    def test_repeated_mountpoints_reported_once(self, mock_statvfs, mock_file):
+        mock_statvfs.return_value = self._mock_statvfs()
+
+        result = disk_extractor._LinuxDiskExtractor().extract()
+
+        # The last mount at a path is the visible one; pseudo filesystems
+        # are left out, even when they hide an earlier real mount
+        self.assertEqual([(p['filesystem'], p['mountpoint']) for p in result['partitions']],
+                         [('/dev/sda1', '/'), ('tmpfs', '/dev/shm')])
+
+    @patch('os.statvfs')
+    @patch.object(disk_extractor._LinuxDiskExtractor, '_mounts_changed', side_effect=[True, False])
+    def test_mount_table_is_reread_only_on_change(self, mock_changed, mock_statvfs):
+        mock_statvfs.return_value = self._mock_statvfs()
+        extractor = disk_extractor._LinuxDiskExtractor()
+
+        with patch('builtins.open', mock_open(read_data='/dev/sda1 / ext4 rw 0 0\n')) as mock_file:
+            extractor.extract()
+            result = extractor.extract()
+
+        mock_file.assert_called_once()
+        self.assertEqual([p['mountpoint'] for p in result['partitions']], ['/'])
 
     @patch('subprocess.run')
     @patch('os.statvfs')
-    def test_extract_disk_info(self, mock_statvfs, mock_subprocess):
+    def test_extract_disk_info_from_df(self, mock_statvfs, mock_subprocess):
+        mock_statvfs.return_value = self._mock_statvfs()
+
         # Mock df command
         mock_result = unittest.mock.MagicMock()
         mock_result.returncode = 0
-        mock_result.stdout = 'Filesystem     1K-blocks    Used Available Use% Mounted on\n/dev/sda1       10000000 5000000  5000000  50% /\n'
+        mock_result.stdout = 'Filesystem     1024-blocks    Used Available Capacity Mounted on\n/dev/sda1       10000000 5000000  5000000  50% /\n'
         mock_subprocess.return_value = mock_result
 
-        # Mock statvfs
-        mock_stat = unittest.mock.MagicMock()
-        mock_stat.f_blocks = 1000000
-        mock_stat.f_frsize = 1024
-        mock_stat.f_available = 500000
-        mock_statvfs.return_value = mock_stat
-
-        result = self.extractor.extract()
+        result = disk_extractor._GenericDiskExtractor().extract()
 
         self.assertIn('partitions', result)
         self.assertIn('root_usage', result)
         self.assertGreater(len(result['partitions']), 0)
+        self.assertEqual(result['partitions'][0]['free'], 5000000 * 1024)
 
 
 class TestProcessExtractor(unittest.TestCase):
     """Test process information extractor"""
 
-    def setUp(self):
-        self.extractor = ProcessExtractor()
-
     @patch('subprocess.run')
     def test_extract_process_info(self, mock_subprocess):
         # Mock ps command output
@@ -136,12 +276,186 @@ class TestProcessExtractor(unittest.TestCase):
         mock_result.stdout = 'USER       PID %CPU %MEM    VSZ   RSS TTY      STAT START   TIME COMMAND\nroot         1  0.0  0.1  12345  1234 ?        Ss   10:00   0:01 init\n'
         mock_subprocess.return_value = mock_result
 
-        result = self.extractor.extract()
+        result = process_extractor._GenericProcessExtractor().extract()
 
         self.assertIn('process_count', result)
         self.assertIn('processes', result)
         self.assertGreater(result['process_count'], 0)
 
+    def test_extract_process_info_from_proc(self):
+        with tempfile.TemporaryDirectory() as proc_root:
+            with open(os.path.join(proc_root, 'uptime'), 'w') as f:
+                f.write('1000.00 4000.00\n')
+            os.mkdir(os.path.join(proc_root, 'self'))
+            os.mkdir(os.path.join(proc_root, '42'))
+            with open(os.path.join(proc_root, '42', 'stat'), 'w') as f:
+                # comm containing spaces and parentheses must not shift the fields
+                f.write('42 (my (odd) proc) S 1 42 42 0 -1 4194560 100 0 0 0 '
+                        '300 200 0 0 20 0 1 0 50000 10240000 256 18446744073709551615\n')
+            with open(os.path.join(proc_root, '42', 'cmdline'), 'w') as f:
+                f.write('/usr/bin/odd\0--flag\0')
+            with open(os.path.join(proc_root, '42', 'status'), 'w') as f:
+                f.write('Name:\tmy (odd) proc\nUid:\t1000\t0\t0\t0\n')
+
+            with patch('src.extractors.process_extractor._PROC_ROOT', proc_root):
+                result = process_extractor._LinuxProcessExtractor().extract()
+
+        self.assertEqual(result['process_count'], 1)
+        process = result['processes'][0]
+        self.assertEqual(process['pid'], 42)
+        self.assertEqual(process['stat'], 'S')
+        self.assertEqual(process['tty'], '?')
+        self.assertEqual(process['vsz'], 10000)
+        self.assertEqual(process['command'], '/usr/bin/odd --flag')
+        self.assertGreater(process['cpu_percent'], 0)
+        # The effective uid, as ps shows for setuid programs
+        self.assertEqual(process['user'], process_extractor._LinuxProcessExtractor()._user_name(0))
+
+    @patch('subprocess.run')
+    def test_proc_and_ps_rows_share_schema(self, mock_subprocess):
+        mock_result = unittest.mock.MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = 'USER       PID %CPU %MEM    VSZ   RSS TTY      STAT START   TIME COMMAND\nroot         1  0.0  0.1  12345  1234 ?        Ss   10:00   0:01 init\n'
+        mock_subprocess.return_value = mock_result
+        ps_process = process_extractor._GenericProcessExtractor().extract()['processes'][0]
+
+        with tempfile.TemporaryDirectory() as proc_root:
+            with open(os.path.join(proc_root, 'uptime'), 'w') as f:
+                f.write('1000.00 4000.00\n')
+            os.mkdir(os.path.join(proc_root, '1'))
+            with open(os.path.join(proc_root, '1', 'stat'), 'w') as f:
+                f.write('1 (init) S 0 1 1 0 -1 0 0 0 0 0 10 0 0 0 20 0 1 0 100 4096 1 0\n')
+            with open(os.path.join(proc_root, '1', 'cmdline'), 'w') as f:
+                f.write('init\0')
+            with open(os.path.join(proc_root, '1', 'status'), 'w') as f:
+                f.write('Uid:\t0\t0\t0\t0\n')
+
+            with patch('src.extractors.process_extractor._PROC_ROOT', proc_root):
+                proc_process = process_extractor._LinuxProcessExtractor().extract()['processes'][0]
+
+        self.assertEqual({key: type(value) for key, value in proc_process.items()},
+                         {key: type(value) for key, value in ps_process.items()})
+
+    def test_only_top_processes_are_inflated(self):
+        with tempfile.TemporaryDirectory() as proc_root:
+            with open(os.path.join(proc_root, 'uptime'), 'w') as f:
+                f.write('1000.00 4000.00\n')
+            for pid, utime in (('7', 10), ('8', 900)):
+                os.mkdir(os.path.join(proc_root, pid))
+                with open(os.path.join(proc_root, pid, 'stat'), 'w') as f:
+                    f.write(f'{pid} (worker) S 1 1 1 0 -1 0 0 0 0 0 {utime} 0 0 0 20 0 1 0 '
+                            '100 4096 1 0\n')
+            # Only the busiest process gets its command line and owner read
+            with open(os.path.join(proc_root, '8', 'cmdline'), 'w') as f:
+                f.write('busy\0')
+            with open(os.path.join(proc_root, '8', 'status'), 'w') as f:
+                f.write('Uid:\t0\t0\t0\t0\n')
+
+            with patch('src.extractors.process_extractor._PROC_ROOT', proc_root), \
+                    patch('src.extractors.process_extractor.TOP_PROCESS_COUNT', 1):
+                result = process_extractor._LinuxProcessExtractor().extract()
+
+        self.assertEqual(result['process_count'], 2)
+        self.assertEqual([p['command'] for p in result['processes']], ['busy'])
+
+    def test_cpu_percent_is_measured_since_previous_scan(self):
+        extractor = process_extractor._LinuxProcessExtractor()
+        with tempfile.TemporaryDirectory() as proc_root:
+            os.mkdir(os.path.join(proc_root, '42'))
+            open(os.path.join(proc_root, '42', 'cmdline'), 'w').close()
+            with open(os.path.join(proc_root, '42', 'status'), 'w') as f:
+                f.write('Uid:\t0\t0\t0\t0\n')
+
+            def write_sample(uptime, utime):
+                with open(os.path.join(proc_root, 'uptime'), 'w') as f:
+                    f.write(f'{uptime} 0.00\n')
+                with open(os.path.join(proc_root, '42', 'stat'), 'w') as f:
+                    f.write(f'42 (busy) R 1 42 42 0 -1 0 0 0 0 0 {utime} 0 0 0 20 0 1 0 '
+                            '1000 4096 1 0\n')
+
+            with patch('src.extractors.process_extractor._PROC_ROOT', proc_root):
+                write_sample('1000.00', 0)
+                extractor.extract()
+                # 500 ticks of CPU time over the 10 seconds between the two scans
+                write_sample('1010.00', 500)
+                result = extractor.extract()
+
+        expected = round(500 / os.sysconf('SC_CLK_TCK') / 10 * 100, 1)
+        self.assertEqual(result['processes'][0]['cpu_percent'], expected)
+
+
+class TestShellBulk(unittest.TestCase):
+    """Test shared shell command output"""
+
+    @patch('subprocess.run')
+    def test_fetch_bulk_splits_sections(self, mock_subprocess):
+        mock_result = unittest.mock.MagicMock()
+        mock_result.stdout = 'Filesystem 1024-blocks\n--DF-- 0\nUSER PID\nroot 1\n--PS-- 1\n'
+        mock_subprocess.return_value = mock_result
+
+        bulk = fetch_bulk(['df', 'ps'])
+
+        # ps exited non-zero; it is recorded as failed rather than run again
+        self.assertEqual(bulk, {'df': 'Filesystem 1024-blocks', 'ps': None})
+        self.assertIsNone(command_output('ps', bulk))
+        self.assertEqual(mock_subprocess.call_count, 1)
+
+    @patch('subprocess.run')
+    @patch('os.statvfs')
+    def test_disk_extractor_uses_bulk_output(self, mock_statvfs, mock_subprocess):
+        mock_statvfs.return_value = unittest.mock.MagicMock(f_blocks=100, f_frsize=1024, f_bavail=40)
+        bulk = {'df': 'Filesystem 1024-blocks Used Available Capacity Mounted on\n'
+                      '/dev/sda1 100 60 40 60% /'}
+
+        result = disk_extractor._GenericDiskExtractor().extract(bulk)
+
+        mock_subprocess.assert_not_called()
+        self.assertEqual(result['partitions'][0]['free'], 40 * 1024)
+
+
+class TestFusedTriggerExtractor(unittest.TestCase):
+    """Test fused CPU and memory extractor"""
+
+    def test_extract_trigger_sections(self):
+        cpu = unittest.mock.MagicMock()
+        cpu.safe_extract.return_value = {'cpu_percent': 12.5}
+        memory = unittest.mock.MagicMock()
+        memory.safe_extract.return_value = {'virtual_memory': {'percent': 40.0}}
+
+        result = FusedTriggerExtractor(cpu, memory).extract()
+
+        self.assertEqual(result, {
+            'cpu': {'cpu_percent': 12.5},
+            'memory': {'virtual_memory': {'percent': 40.0}}
+        })
+
+
+@unittest.skipUnless(IS_LINUX, 'procfs is only read on Linux')
+class TestProcfsExtractors(unittest.TestCase):
+    """Test the Linux extractors read procfs without running commands"""
+
+    @patch('subprocess.run', side_effect=AssertionError('no command should run on Linux'))
+    @patch('subprocess.Popen', side_effect=AssertionError('no command should run on Linux'))
+    def test_extractors_do_not_spawn_processes(self, mock_popen, mock_run):
+        for extractor_class in (CpuExtractor, MemoryExtractor, DiskExtractor, ProcessExtractor):
+            extractor = extractor_class()
+            self.addCleanup(extractor.close)
+            with self.subTest(extractor=extractor_class.__name__):
+                self.assertIsNone(extractor_class.bulk_section)
+                self.assertTrue(extractor.extract())
+
+
+class TestSharedExtractors(unittest.TestCase):
+    """Test process-wide extractor instances"""
+
+    def test_get_extractor_returns_singletons(self):
+        self.assertIs(get_extractor('cpu'), get_extractor('cpu'))
+        self.assertIsInstance(get_extractor('cpu'), CpuExtractor)
+        self.assertIsInstance(get_extractor('trigger'), FusedTriggerExtractor)
+
+    def test_trigger_shares_cpu_extractor(self):
+        self.assertIs(get_extractor('trigger')._cpu, get_extractor('cpu'))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,12 +2,14 @@
 Tests for monitoring functionality
 """
 
+import io
 import unittest
 from unittest.mock import patch, MagicMock
 import json
 
 from src.monitoring import SystemMonitor
-from src.utils import format_trigger_event
+from src.utils import format_trigger_event, format_success_output
+from src.utils import formatting
 
 
 class TestSystemMonitor(unittest.TestCase):
@@ -20,6 +22,7 @@ class TestSystemMonitor(unittest.TestCase):
             'mem_trigger_percentage': 85
         }
         self.monitor = SystemMonitor(self.config)
+        self.addCleanup(self.monitor.agent_client.disconnect)
 
     def test_initialization(self):
         """Test monitor initialization"""
@@ -59,11 +62,14 @@ class TestSystemMonitor(unittest.TestCase):
             'mem_trigger_percentage': 0
         }
         monitor = SystemMonitor(config)
+        self.addCleanup(monitor.agent_client.disconnect)
         data = {
             'cpu': {'cpu_percent': 90.0},
             'memory': {'virtual_memory': {'percent': 95.0}}
         }
         self.assertFalse(monitor.should_trigger(data))
+        # Disabled checks do not even look at the data
+        self.assertFalse(monitor.should_trigger({}))
 
     def test_output_trigger_event(self):
         """Test trigger event output formatting"""
@@ -96,8 +102,62 @@ class TestSystemMonitor(unittest.TestCase):
             mock_sleep.side_effect = KeyboardInterrupt()
             self.monitor.start_monitoring(mock_extractor)
 
-        # Verify sleep was called
-        mock_sleep.assert_called_once_with(30)
+        # Verify sleep was called for the remainder of the interval
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 30, places=2)
+        # Stopping releases the agent connection
+        self.assertFalse(self.monitor.agent_client.is_connected())
+
+    @patch('src.monitoring.monitor.SystemMonitor.should_trigger', return_value=False)
+    def test_monitoring_loop_compensates_for_extraction_time(self, mock_should_trigger):
+        """Test cycles follow a fixed timeline and resync after an overrun"""
+        clock = [1000.0]
+        extraction_times = iter([5.0, 40.0, 5.0, 5.0])
+        sleeps = []
+
+        def extract():
+            clock[0] += next(extraction_times)
+            return {}
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            if len(sleeps) == 3:
+                raise KeyboardInterrupt()
+            clock[0] += seconds
+
+        with patch('time.monotonic', side_effect=lambda: clock[0]), \
+                patch('time.sleep', side_effect=sleep):
+            self.monitor.start_monitoring(extract)
+
+        # The 40s cycle overran the 30s interval, so it is not followed by a sleep
+        self.assertEqual(sleeps, [25.0, 25.0, 25.0])
+
+    @patch('time.sleep', side_effect=[None, None, KeyboardInterrupt()])
+    @patch('src.monitoring.monitor.SystemMonitor.should_trigger', return_value=False)
+    def test_cycle_logs_are_uploaded_in_batches(self, mock_should_trigger, mock_sleep):
+        """Test per-cycle log entries are buffered until the loop exits"""
+        with patch.object(self.monitor.agent_client, 'upload_logs') as mock_upload:
+            self.monitor.start_monitoring(lambda: {'timestamp': '2025-01-01T12:00:00'})
+
+        # The start entry goes out immediately, then three cycles plus the stop entry
+        self.assertEqual([len(call[0][0]) for call in mock_upload.call_args_list], [1, 4])
+
+    @patch('time.sleep', side_effect=KeyboardInterrupt())
+    @patch('src.monitoring.monitor.SystemMonitor.should_trigger', return_value=True)
+    def test_trigger_event_is_single_json_line(self, mock_should_trigger, mock_sleep):
+        """Test the default trigger output puts the event on one line with either encoder"""
+        for encoder in (formatting.orjson, None):
+            with patch('src.utils.formatting.orjson', encoder), \
+                    patch('sys.stdout', new_callable=io.StringIO) as mock_stdout:
+                self.monitor.start_monitoring(lambda: {'cpu': {'cpu_percent': 99.0}})
+
+            lines = mock_stdout.getvalue().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertEqual(lines[0], lines[2])
+            event_data = json.loads(lines[1])['data']
+            self.assertEqual(event_data['cpu'], {'cpu_percent': 99.0})
+            # Data without a timestamp is stamped once by the loop
+            self.assertIn('timestamp', event_data)
 
 
 class TestFormatting(unittest.TestCase):
@@ -116,6 +176,30 @@ class TestFormatting(unittest.TestCase):
         self.assertIn('date_triggered', parsed)
         self.assertEqual(parsed['data'], data)
 
+    def test_format_success_output_is_compact(self):
+        """Test success output is a single compact JSON document with either encoder"""
+        data = {'cpu': {'cpu_percent': 5.0}}
+
+        for encoder in (formatting.orjson, None):
+            with patch('src.utils.formatting.orjson', encoder):
+                result = format_success_output(data)
+
+            self.assertNotIn('\n', result)
+            self.assertNotIn(', ', result)
+            self.assertEqual(json.loads(result), {'status': 'success', 'data': data})
+
+    def test_json_line_matches_across_encoders(self):
+        """Test trigger event lines are the same with or without orjson"""
+        event = {'host': 'h\u00f4te', 1: 'int key'}
+
+        lines = []
+        for encoder in (formatting.orjson, None):
+            with patch('src.utils.formatting.orjson', encoder):
+                lines.append(formatting.format_json_line(event))
+
+        self.assertEqual(lines[0], lines[1])
+        self.assertEqual(lines[1], '{"host":"h\u00f4te","1":"int key"}')
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file